@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Batch Renderer
+Renders one personalized journal per user record in a single process
+"""
+
+import argparse
+import json
+import os
+import re
+import tempfile
+
+from generate import iter_page_specs
+from quotes import QuoteCorpus
+from templates import REGISTRY
+
+# user_id becomes a file name: no separators, no leading dot
+_SAFE_USER_ID = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9_.-]*")
+
+def user_options(record):
+    """Map a user record onto the personalization options of ``iter_page_specs``.
+
+    A record carries the same rows ``/api/journal/generate`` loads:
+    ``journal_entries``, ``weekly_reviews``, ``goals`` and ``foundation``.
+    Foundation rows are accepted but the foundation pages have no slots
+    for them yet, so they render blank. An optional ``quote_seed`` gives
+    the user their own quote rotation.
+    """
+    return {
+        "entries": record.get("journal_entries"),
+        "reviews": record.get("weekly_reviews"),
+        "goals": record.get("goals"),
+        "quote_seed": record.get("quote_seed"),
+    }
+
+def output_path(out_dir, record, suffix):
+    """``<out_dir>/<user_id><suffix>``; raises ValueError for an id that is not a plain file name."""
+    user_id = str(record.get("user_id", ""))
+    if not _SAFE_USER_ID.fullmatch(user_id):
+        raise ValueError(f"user_id {user_id!r} is not a safe file name")
+    return os.path.join(out_dir, user_id + suffix)
+
+def _is_personal(name, values, seeded):
+    # A seeded rotation gives every user their own day quotes, so those pages
+    # would never be shared and must not fill up the shared table either
+    return name.endswith("_entry") or (seeded and "quote_text" in values)
+
+class BatchRenderer:
+    """Render many personalized journals, sharing every page that carries no user data.
+
+    Shared pages (cover, dividers, blank day and week pages, VICTORY,
+    Legacy Message) are rendered and UTF-8 encoded once; every later user
+    gets the same bytes object by reference. Day pages of a user with a
+    ``quote_seed`` are rendered per user, so the shared table holds at
+    most one edition's worth of pages however many users run.
+    """
+
+    def __init__(self, **options):
+        # Edition options (length, quote corpora) shared by every user
+        self.options = options
+        self._shared = {}
+        self.users = 0
+        self.rendered = 0
+        self.reused = 0
+        self.bytes_written = 0
+
+    def _render(self, template, values):
+        self.rendered += 1
+        return template.render(**values).encode("utf-8")
+
+    def iter_chunks(self, record):
+        """Yield the encoded pages of one user's journal in document order."""
+        get = REGISTRY.get
+        shared = self._shared
+        options = user_options(record)
+        seeded = options["quote_seed"] is not None
+        for name, values in iter_page_specs(**self.options, **options):
+            if _is_personal(name, values, seeded):
+                yield self._render(get(name), values)
+                continue
+            key = (name, tuple(values.items()))
+            data = shared.get(key)
+            if data is None:
+                data = shared[key] = self._render(get(name), values)
+            else:
+                self.reused += 1
+            yield data
+
+    def write(self, record, path):
+        """Stream one user's journal to ``path`` atomically; returns bytes written."""
+        written = 0
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for data in self.iter_chunks(record):
+                    f.write(data)
+                    written += len(data)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.users += 1
+        self.bytes_written += written
+        return written
+
+    def run(self, records, out_dir):
+        """Write ``<out_dir>/<user_id>.html`` for every record in ``records``."""
+        os.makedirs(out_dir, exist_ok=True)
+        for record in records:
+            self.write(record, output_path(out_dir, record, ".html"))
+        return self
+
+    def report(self):
+        return (f"{self.users} journals, {self.rendered} pages rendered, "
+                f"{self.reused} shared pages reused, {self.bytes_written / 1024 / 1024:.1f} MB written")
+
+def read_records(path):
+    """Lazily read user records from a JSON-lines file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render one personalized journal per user record.")
+    parser.add_argument("records", help="JSON-lines file with one user record per line")
+    parser.add_argument("out_dir", help="directory for the per-user HTML files")
+    parser.add_argument("--quotes", metavar="CORPUS", help="draw day quotes from this JSON-lines corpus")
+    parser.add_argument("--wisdom", metavar="CORPUS", help="draw footer wisdom from this JSON-lines corpus")
+    args = parser.parse_args()
+
+    options = {}
+    for name in ("quotes", "wisdom"):
+        path = getattr(args, name)
+        if path:
+            try:
+                options[name] = QuoteCorpus(path)
+            except (OSError, ValueError) as exc:
+                parser.error(f"--{name}: {exc}")
+    try:
+        renderer = BatchRenderer(**options).run(read_records(args.records), args.out_dir)
+    except ValueError as exc:
+        parser.exit(1, f"❌ {exc}\n")
+
+    print(f"✅ {renderer.report()}")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Generator Benchmarks
+Times the full build, each section and personalized builds against a stored baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from generate import SECTIONS, TEMPLATE_SECTIONS, VARIANTS, iter_page_specs, write_html
+from templates import REGISTRY
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench-baseline.json")
+DEFAULT_THRESHOLD = 0.25
+FILL_LEVELS = (0, 50, 100)
+# Timings below this are dominated by timer noise and are not compared
+MIN_COMPARABLE_SECONDS = 50e-6
+
+MOODS = ("happy", "grateful", "focused", "motivated", "peaceful", "energized")
+
+class _NullSink:
+    """Binary sink that only counts what is written."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+        return len(data)
+
+def synthetic_entries(fill, seed=90):
+    """Build journal_entries rows for ``fill`` percent of the 90 days."""
+    rng = random.Random(seed)
+    days = sorted(rng.sample(range(1, 91), round(90 * fill / 100)))
+    rows = []
+    for day in days:
+        rows.append({
+            "day_number": day,
+            "entry_date": f"2025-{(day - 1) // 28 + 1:02d}-{(day - 1) % 28 + 1:02d}",
+            "gratitude": f"Grateful for day {day} & the people <around> me",
+            "priority_1": f"Ship milestone {day}",
+            "priority_2": "Train for 45 minutes",
+            "priority_3": "Read 20 pages",
+            "tasks": [{"id": i, "text": f"Task {i} for day {day}", "completed": i % 2 == 0} for i in range(4)],
+            "reflection": "Stayed focused in the morning.\nLost time to email after lunch.",
+            "mood": rng.choice(MOODS),
+        })
+    return rows
+
+def _full_build(**options):
+    def run():
+        sink = _NullSink()
+        write_html(sink, **options)
+        return sink.bytes
+    return run
+
+def _section_build(section):
+    specs = [(REGISTRY.get(name), values) for name, values in iter_page_specs()
+             if TEMPLATE_SECTIONS[name] == section]
+
+    def run():
+        return sum(len(template.render(**values).encode("utf-8")) for template, values in specs)
+    return run
+
+def _model_build(backend=None):
+    from page_model import build_journal, iter_html, iter_json
+    journal = build_journal()
+    serialize = {"html": iter_html, "json": iter_json}.get(backend)
+
+    def run():
+        if serialize is None:
+            build_journal()
+            return 0
+        return sum(len(chunk.encode("utf-8")) for chunk in serialize(journal))
+    return run
+
+def cases():
+    """Return ``{case_name: callable}``; each callable returns the bytes it produced."""
+    found = {"full": _full_build()}
+    for section in SECTIONS:
+        found[f"section:{section}"] = _section_build(section)
+    for fill in FILL_LEVELS:
+        found[f"personalized:{fill}%"] = _full_build(entries=synthetic_entries(fill))
+    found["model:build"] = _model_build()
+    for backend in ("html", "json"):
+        found[f"model:{backend}"] = _model_build(backend)
+    for variant, options in VARIANTS.items():
+        if "days" in options:
+            found[f"edition:{variant}"] = _full_build(**options)
+    return found
+
+def measure(run, repeat):
+    """Best-of-``repeat`` wall time, plus peak traced memory from one extra run."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output_bytes = run()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak, "output_bytes": output_bytes}
+
+def compare(results, baseline, threshold):
+    """List ``(case, metric, old, new)`` for every metric that grew past ``threshold``."""
+    regressions = []
+    for case, result in results.items():
+        old = baseline.get(case)
+        if not old:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if metric == "seconds" and old.get(metric, 0) < MIN_COMPARABLE_SECONDS:
+                continue
+            if old.get(metric) and result[metric] > old[metric] * (1 + threshold):
+                regressions.append((case, metric, old[metric], result[metric]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the journal generator.")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--update-baseline", "--save", dest="update_baseline", action="store_true",
+                        help="write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown / memory growth before failing (0.25 = 25%%)")
+    parser.add_argument("--only", help="run only cases whose name contains this text")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, run in cases().items():
+        if args.only and args.only not in name:
+            continue
+        results[name] = measure(run, args.repeat)
+        r = results[name]
+        print(f"{name:<24} {r['seconds'] * 1000:9.2f} ms {r['peak_bytes'] / 1024:9.1f} KB peak "
+              f"{r['output_bytes'] / 1024:9.1f} KB out")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"✅ Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        # Without a baseline nothing was checked; failing keeps CI from passing silently
+        print(f"❌ No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 1
+
+    regressions = compare(results, baseline, args.threshold)
+    for case, metric, old, new in regressions:
+        print(f"❌ {case}: {metric} {old:.6g} -> {new:.6g} (+{(new / old - 1) * 100:.0f}%)")
+    if regressions:
+        return 1
+    print(f"✅ No regressions above {args.threshold * 100:.0f}%")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Calendar Table
+Precomputes every date a dated edition prints, once per start date, length and locale
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+
+DEFAULT_LOCALE = "en-US"
+
+# Per locale: numeric date, day-month and week-range patterns, then
+# weekday names (Monday first) and month names. Kept here rather than
+# read from the system locale so every build machine prints the same.
+LOCALES = {
+    "en-US": {
+        "date": "{month:02d}/{day:02d}/{year}",
+        "day_month": "{mon} {day}",
+        "same_month": "{mon} {first}–{last}",
+        "with_year": "{text}, {year}",
+        "weekdays": ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"),
+        "months": ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+    },
+    "en-GB": {
+        "date": "{day:02d}/{month:02d}/{year}",
+        "day_month": "{day} {mon}",
+        "same_month": "{first}–{last} {mon}",
+        "with_year": "{text} {year}",
+        "weekdays": ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"),
+        "months": ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+    },
+    "de-DE": {
+        "date": "{day:02d}.{month:02d}.{year}",
+        "day_month": "{day}. {mon}",
+        "same_month": "{first}.–{last}. {mon}",
+        "with_year": "{text} {year}",
+        "weekdays": ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"),
+        "months": ("Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"),
+    },
+    "fr-FR": {
+        "date": "{day:02d}/{month:02d}/{year}",
+        "day_month": "{day} {mon}",
+        "same_month": "{first}–{last} {mon}",
+        "with_year": "{text} {year}",
+        "weekdays": ("Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim"),
+        "months": ("janv", "févr", "mars", "avr", "mai", "juin", "juil", "août", "sept", "oct", "nov", "déc"),
+    },
+    "es-ES": {
+        "date": "{day:02d}/{month:02d}/{year}",
+        "day_month": "{day} {mon}",
+        "same_month": "{first}–{last} {mon}",
+        "with_year": "{text} {year}",
+        "weekdays": ("Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom"),
+        "months": ("ene", "feb", "mar", "abr", "may", "jun", "jul", "ago", "sept", "oct", "nov", "dic"),
+    },
+}
+
+def parse_start_date(value):
+    """Accept a ``date`` or an ISO ``YYYY-MM-DD`` string."""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"start date must be YYYY-MM-DD, not {value!r}") from None
+
+class CalendarTable:
+    """The dates of one edition, laid out for direct lookup by day and week number.
+
+    ``day_dates[day - 1]`` is the label printed on both pages of a daily
+    spread, ``week_ranges[week - 1]`` the date range and ISO week of a
+    weekly review and ``week_headers[week - 1]`` the grid-tracker column
+    headings for that week's seven days.
+    """
+
+    def __init__(self, start, days, locale=DEFAULT_LOCALE, days_per_week=7):
+        if locale not in LOCALES:
+            raise ValueError(f"unknown locale {locale!r} (choose from {', '.join(sorted(LOCALES))})")
+        spec = LOCALES[locale]
+        self.start = start
+        self.locale = locale
+        dates = [start + timedelta(days=offset) for offset in range(days)]
+        self.day_dates = [
+            f"{spec['weekdays'][when.weekday()]} "
+            + spec["date"].format(day=when.day, month=when.month, year=when.year)
+            for when in dates
+        ]
+        # Only seven header rows exist, one per starting weekday; weeks share them
+        headers = {}
+        for weekday in range(7):
+            initials = [spec["weekdays"][(weekday + i) % 7][0] for i in range(days_per_week)]
+            headers[weekday] = {f"weekday_{i}": initial for i, initial in enumerate(initials, start=1)}
+        self.week_ranges = []
+        self.week_headers = []
+        for first_day in range(1, days + 1, days_per_week):
+            week = dates[first_day - 1:first_day - 1 + days_per_week]
+            self.week_ranges.append(self._week_range(spec, week))
+            self.week_headers.append(headers[week[0].weekday()])
+
+    def _week_range(self, spec, week):
+        first, last = week[0], week[-1]
+        months = spec["months"]
+        if (first.year, first.month) == (last.year, last.month):
+            text = spec["same_month"].format(first=first.day, last=last.day, mon=months[first.month - 1])
+            text = spec["with_year"].format(text=text, year=last.year)
+        else:
+            start = spec["day_month"].format(day=first.day, mon=months[first.month - 1])
+            end = spec["day_month"].format(day=last.day, mon=months[last.month - 1])
+            if first.year != last.year:
+                start = spec["with_year"].format(text=start, year=first.year)
+            text = start + " – " + spec["with_year"].format(text=end, year=last.year)
+        iso_first, iso_last = first.isocalendar()[1], last.isocalendar()[1]
+        iso = f"W{iso_first:02d}" if iso_first == iso_last else f"W{iso_first:02d}/{iso_last:02d}"
+        return f"{text} · {iso}"
+
+@lru_cache(maxsize=256)
+def _cached_table(start, days, locale, days_per_week):
+    return CalendarTable(start, days, locale, days_per_week)
+
+def calendar_table(start, days, locale=DEFAULT_LOCALE, days_per_week=7):
+    """Return the shared ``CalendarTable`` for an edition, building it on first use."""
+    return _cached_table(parse_start_date(start), days, locale, days_per_week)
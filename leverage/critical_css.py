@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Critical CSS
+Prunes css/journal.css to the rules the generated pages can match and inlines it
+"""
+
+import hashlib
+import html
+import os
+import re
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STYLESHEET_HREF = "css/journal.css"
+DEFAULT_STYLESHEET = os.path.join(HERE, STYLESHEET_HREF)
+DEFAULT_CACHE_DIR = os.path.join(HERE, "build", "css-cache")
+# Bump when the pruning rules change so cached results are rebuilt
+PRUNER_VERSION = 2
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CLASS_ATTR = re.compile(r'\sclass="([^"]*)"')
+_ID_ATTR = re.compile(r'\sid="([^"{}]*)"')
+_ELEMENT = re.compile(r"<([a-zA-Z][\w-]*)")
+# Pseudo-classes (with any arguments, e.g. :not(.x)) and attribute selectors never rule a selector out
+_PSEUDO = re.compile(r"::?[\w-]+(\([^)]*\))?")
+_ATTRIBUTE = re.compile(r"\[[^\]]*\]")
+_SEL_CLASS = re.compile(r"\.([\w-]+)")
+_SEL_ID = re.compile(r"#([\w-]+)")
+_SEL_TYPE = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+_KEYFRAMES = re.compile(r"@(?:-\w+-)?keyframes\s+([\w-]+)")
+_RELATIVE_URL = re.compile(r"""url\((['"]?)(?!data:|[a-z]+://|/|#)([^'")]+)\1\)""")
+_IMPORT_URL = re.compile(r"""@import\s+(?:url\(\s*)?(['"]?)([^'")\s]+)\1""")
+_ALWAYS_TYPES = frozenset(("html", "body"))
+
+def _scan(markup, classes, ids, elements):
+    for attr in _CLASS_ATTR.findall(markup):
+        classes.update(token for token in attr.split() if "{{" not in token)
+    ids.update(_ID_ATTR.findall(markup))
+    elements.update(element.lower() for element in _ELEMENT.findall(markup))
+
+def emitted_names(registry, specs=()):
+    """Class names, ids and element names the templates of ``registry`` and the slot values in ``specs`` emit.
+
+    Some slot values carry markup of their own (the foundation pages), so
+    they are scanned as well as the template sources.
+    """
+    classes, ids, elements = set(), set(), set(_ALWAYS_TYPES)
+    for name in registry:
+        _scan(registry.get(name).source, classes, ids, elements)
+    for _name, values in specs:
+        for value in values.values():
+            if isinstance(value, str) and "<" in value:
+                _scan(value, classes, ids, elements)
+    return frozenset(classes), frozenset(ids), frozenset(elements)
+
+def parse_rules(css):
+    """Split CSS into ``(prelude, body)`` pairs; ``body`` is None for statements such as ``@import``."""
+    items, start, i, depth = [], 0, 0, 0
+    open_at = None
+    while i < len(css):
+        char = css[i]
+        if char in "\"'":
+            i = css.index(char, i + 1)
+        elif char == "{":
+            if depth == 0:
+                open_at = i
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                items.append((css[start:open_at].strip(), css[open_at + 1:i]))
+                start = i + 1
+        elif char == ";" and depth == 0:
+            statement = css[start:i].strip()
+            if statement:
+                items.append((statement, None))
+            start = i + 1
+        i += 1
+    return items
+
+def _split_selectors(prelude):
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return [selector for selector in selectors if selector]
+
+def _compact(text):
+    return " ".join(text.split())
+
+class CriticalCss:
+    """Selector filter for one set of emitted class names, ids and elements."""
+
+    def __init__(self, classes, ids, elements):
+        self.classes = classes
+        self.ids = ids
+        self.elements = elements
+
+    def matches(self, selector):
+        bare = _ATTRIBUTE.sub("", _PSEUDO.sub("", selector))
+        return (all(name in self.classes for name in _SEL_CLASS.findall(bare))
+                and all(name in self.ids for name in _SEL_ID.findall(bare))
+                and all(name.lower() in self.elements for name in _SEL_TYPE.findall(bare)))
+
+    def prune(self, css):
+        """Return the rules of ``css`` that can match, compacted; empty @media blocks are dropped.
+
+        ``@import`` statements are dropped too: inlined, they would block
+        rendering on another request. See ``imported_stylesheets``.
+        """
+        kept = []
+        for prelude, body in parse_rules(css):
+            if body is None:
+                if not prelude.startswith("@import"):
+                    kept.append(prelude + ";")
+            elif prelude.startswith(("@media", "@supports")):
+                inner = self.prune(body)
+                if inner:
+                    kept.append(f"{_compact(prelude)}{{{inner}}}")
+            elif prelude.startswith("@"):
+                kept.append(f"{_compact(prelude)}{{{_compact(body)}}}")
+            else:
+                selectors = [s for s in _split_selectors(prelude) if self.matches(s)]
+                if selectors:
+                    kept.append(f"{','.join(_compact(s) for s in selectors)}{{{_compact(body)}}}")
+        return "".join(kept)
+
+def _drop_unused_keyframes(css):
+    for match in list(_KEYFRAMES.finditer(css)):
+        name = match.group(1)
+        if len(re.findall(rf"\b{re.escape(name)}\b", css)) == 1:
+            block = parse_rules(css[match.start():])[0]
+            css = css.replace(f"{block[0]}{{{block[1]}}}", "", 1)
+    return css
+
+def imported_stylesheets(stylesheet=DEFAULT_STYLESHEET):
+    """URLs the stylesheet pulls in with ``@import`` (the web fonts), in order."""
+    with open(stylesheet, encoding="utf-8") as f:
+        css = _CSS_COMMENT.sub("", f.read())
+    return [_IMPORT_URL.match(prelude).group(2) for prelude, body in parse_rules(css)
+            if body is None and _IMPORT_URL.match(prelude)]
+
+def deferred_stylesheets(urls):
+    """``<link>`` markup that preloads each stylesheet and applies it once loaded, without blocking render."""
+    links = []
+    for url in urls:
+        href = html.escape(url)
+        links.append(f'<link rel="preload" href="{href}" as="style" '
+                     f'onload="this.onload=null;this.rel=\'stylesheet\'">'
+                     f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+    return "".join(links)
+
+def critical_css(registry, specs=(), stylesheet=DEFAULT_STYLESHEET, cache_dir=DEFAULT_CACHE_DIR):
+    """Pruned, compacted CSS for pages rendered from ``registry`` and ``specs``.
+
+    Results are cached by the stylesheet contents and the set of emitted
+    names, so a build whose templates emit the same classes, ids and
+    elements never re-runs the pruning. Relative ``url()``s are rebased
+    onto the stylesheet's directory.
+    """
+    with open(stylesheet, encoding="utf-8") as f:
+        css = f.read()
+    names = emitted_names(registry, specs)
+    fingerprint = "\0".join(" ".join(sorted(group)) for group in names)
+    key = hashlib.sha256(f"{PRUNER_VERSION}\0{css}\0{fingerprint}".encode("utf-8")).hexdigest()
+    cached = os.path.join(cache_dir, key + ".css")
+    try:
+        with open(cached, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    pruner = CriticalCss(*names)
+    pruned = _drop_unused_keyframes(pruner.prune(_CSS_COMMENT.sub("", css)))
+    base = os.path.dirname(STYLESHEET_HREF) + "/"
+    pruned = _RELATIVE_URL.sub(lambda m: f"url({m.group(1)}{base}{m.group(2)}{m.group(1)})", pruned)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(pruned)
+    os.replace(tmp, cached)
+    return pruned
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - EPUB Export
+Streams the journal into an EPUB 3 zip one XHTML document at a time, with shared CSS and fonts stored once
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import tempfile
+import time
+import uuid
+import zipfile
+from html import escape
+
+from batch import output_path, read_records, user_options
+from fonts import DEFAULT_FONTS_DIR, FONT_FACES, find_font
+from generate import SECTIONS, TEMPLATE_SECTIONS, iter_page_specs
+from templates import REGISTRY, SPRITE
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STYLESHEET = os.path.join(HERE, "css", "journal.css")
+LAYOUTS = ("fixed", "reflowable")
+# A5 at 96 dpi, the viewport of every fixed-layout page
+PAGE_WIDTH_PX, PAGE_HEIGHT_PX = 559, 794
+# Stored entries get this timestamp so the same journal always zips to the same bytes
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+SECTION_TITLES = {
+    "cover": "Cover",
+    "commitment": "My Commitment",
+    "foundation": "Foundation",
+    "goals": "Plan",
+    "days": "Do",
+    "weeks": "Achieve",
+    "closing": "Victory",
+}
+
+FONT_MEDIA_TYPES = {".ttf": "font/ttf", ".otf": "font/otf", ".woff": "font/woff", ".woff2": "font/woff2"}
+
+# Screen framing in journal.css (margins, shadows, the fixed A5 box when reflowing) undone for readers
+LAYOUT_CSS = {
+    "fixed": "body{margin:0;padding:0;background:var(--black)}"
+             ".page{margin:0;border:none;box-shadow:none}",
+    "reflowable": "body{margin:0;padding:0;background:var(--black)}"
+                  ".page{width:auto;height:auto;min-height:0;max-height:none;margin:0 0 2em;"
+                  "border:none;box-shadow:none;overflow:visible}",
+}
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+_REMOTE_IMPORT = re.compile(r"@import\s+url\([^)]*\)\s*;")
+_START_TAG = re.compile(r"<([a-zA-Z][\w-]*)(\s[^<>]*?)?(/?)>")
+_ATTRIBUTE = re.compile(r"""([^\s=/]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s"'>]+))?""")
+_SYMBOL_USE = re.compile(r'<use href="#([\w-]+)"')
+_VOID = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source",
+                   "track", "wbr"))
+
+def _xhtml_tag(match):
+    name, attributes, closed = match.groups()
+    parts = []
+    for attr, value in _ATTRIBUTE.findall(attributes or ""):
+        if not value:
+            value = f'"{attr}"'
+        elif value[0] not in "\"'":
+            value = f'"{value}"'
+        parts.append(f" {attr}={value}")
+    if name == "svg" and not any(part.startswith(" xmlns=") for part in parts):
+        # Inline SVG is only SVG in XHTML when it carries its namespace
+        parts.append(f' xmlns="{SVG_NS}" xmlns:xlink="{XLINK_NS}"')
+    elif name == "use":
+        # Older reading systems only follow the SVG 1.1 xlink:href
+        parts.extend(f" xlink:href={part[6:]}" for part in list(parts) if part.startswith(" href="))
+    end = "/>" if closed or name.lower() in _VOID else ">"
+    return f"<{name}{''.join(parts)}{end}"
+
+def to_xhtml(markup):
+    """Make generator markup well-formed XML: close void elements, give bare attributes values
+    and put inline SVG in its namespace.
+
+    Text and attribute values are already escaped by the generator, so
+    start tags are the only thing that needs rewriting.
+    """
+    return _START_TAG.sub(_xhtml_tag, markup)
+
+def _document(title, layout):
+    """Head and tail of an XHTML content document around the page markup."""
+    viewport = (f'\n<meta name="viewport" content="width={PAGE_WIDTH_PX}, height={PAGE_HEIGHT_PX}"/>'
+                if layout == "fixed" else "")
+    head = ('<?xml version="1.0" encoding="UTF-8"?>\n<!DOCTYPE html>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" '
+            'lang="en" xml:lang="en">\n<head>\n<meta charset="UTF-8"/>\n'
+            f'<title>{escape(title)}</title>{viewport}\n'
+            '<link rel="stylesheet" type="text/css" href="css/journal.css"/>\n</head>\n<body>\n')
+    return head, "\n</body>\n</html>\n"
+
+def _stylesheet(layout, fonts):
+    """journal.css without its remote font import, plus local @font-face rules and the reader overrides."""
+    with open(STYLESHEET, encoding="utf-8") as f:
+        css = _REMOTE_IMPORT.sub("", f.read(), count=1)
+    faces = "".join(f"@font-face{{font-family:'{family}';font-style:normal;font-weight:{weight};"
+                    f"src:url(../{href})}}\n" for family, weight, href, _path in fonts)
+    return faces + css + "\n/* EPUB */\n" + LAYOUT_CSS[layout] + "\n"
+
+def _local_fonts(fonts_dir):
+    """``(family, weight, href, path)`` for every journal font found in ``fonts_dir``."""
+    found = []
+    for family, weight, stem in FONT_FACES:
+        path = find_font(fonts_dir, stem)
+        if path:
+            found.append((family, weight, "fonts/" + os.path.basename(path), path))
+    return found
+
+class EpubWriter:
+    """Write one journal as an EPUB 3 archive into an open zip stream.
+
+    Page (or section) documents are rendered and compressed one at a
+    time; only their names and properties are kept for the package
+    document written at the end.
+    """
+
+    def __init__(self, zf, layout="fixed", fonts_dir=DEFAULT_FONTS_DIR, registry=REGISTRY):
+        if layout not in LAYOUTS:
+            raise ValueError(f"unknown EPUB layout {layout!r}")
+        self.zf = zf
+        self.layout = layout
+        self.registry = registry
+        self.fonts = _local_fonts(fonts_dir)
+        self.items = []
+        self.toc = []
+        self.digest = hashlib.sha256()
+
+    @staticmethod
+    def _info(name, compress=True):
+        info = zipfile.ZipInfo(name, ZIP_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        info.external_attr = 0o644 << 16
+        return info
+
+    def _write(self, name, data, compress=True):
+        self.zf.writestr(self._info(name, compress), data)
+
+    def _write_document(self, name, title, chunks):
+        """Stream one XHTML document assembled from ``chunks`` of page markup."""
+        used, has_svg = set(), False
+        with self.zf.open(self._info("OEBPS/" + name), "w") as f:
+            head, tail = _document(title, self.layout)
+            f.write(head.encode("utf-8"))
+            for markup in chunks:
+                used.update(_SYMBOL_USE.findall(markup))
+                has_svg = has_svg or "<svg" in markup
+                data = to_xhtml(markup).encode("utf-8")
+                self.digest.update(data)
+                f.write(data)
+            if used:
+                # <use> may point forward, so the symbols a document needs go last
+                f.write(to_xhtml(SPRITE.markup(used)).encode("utf-8"))
+            f.write(tail.encode("utf-8"))
+        self.items.append((name, "svg" if has_svg else None))
+
+    def write(self, specs):
+        """Write the whole archive from ``(template_name, slot_values)`` page specs."""
+        self._write("mimetype", "application/epub+zip", compress=False)
+        self._write("META-INF/container.xml",
+                    '<?xml version="1.0" encoding="UTF-8"?>\n'
+                    '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">\n'
+                    '<rootfiles><rootfile full-path="OEBPS/content.opf" '
+                    'media-type="application/oebps-package+xml"/></rootfiles>\n</container>\n')
+        self._write("OEBPS/css/journal.css", _stylesheet(self.layout, self.fonts))
+        for _family, _weight, href, path in self.fonts:
+            # WOFF and WOFF2 are compressed already; deflating them again only costs time
+            info = self._info("OEBPS/" + href, compress=path.endswith((".ttf", ".otf")))
+            with open(path, "rb") as src, self.zf.open(info, "w") as dst:
+                dst.write(src.read())
+
+        get = self.registry.get
+        pages = ((name, values) for name, values in specs if name not in ("document_head", "document_tail"))
+        if self.layout == "fixed":
+            for name, values in pages:
+                number = values["page"]
+                document = f"page-{number}.xhtml"
+                if not self.toc or self.toc[-1][0] != TEMPLATE_SECTIONS[name]:
+                    self.toc.append((TEMPLATE_SECTIONS[name], document))
+                self._write_document(document, f"Page {int(number)}", [get(name).render(**values)])
+        else:
+            section, run = None, []
+            for name, values in pages:
+                if TEMPLATE_SECTIONS[name] != section and run:
+                    self._write_section(section, run)
+                    run = []
+                section = TEMPLATE_SECTIONS[name]
+                run.append((name, values))
+            if run:
+                self._write_section(section, run)
+        self._write_nav()
+        self._write_package()
+
+    def _write_section(self, section, run):
+        document = f"{SECTIONS.index(section) + 1:02d}-{section}.xhtml"
+        self.toc.append((section, document))
+        get = self.registry.get
+        self._write_document(document, SECTION_TITLES[section],
+                             (get(name).render(**values) for name, values in run))
+
+    def _write_nav(self):
+        entries = "".join(f'<li><a href="{document}">{escape(SECTION_TITLES[section])}</a></li>\n'
+                          for section, document in self.toc)
+        head, tail = _document("Contents", "reflowable")
+        self._write("OEBPS/nav.xhtml", head + '<nav epub:type="toc" id="toc"><h1>Contents</h1>\n<ol>\n'
+                    + entries + "</ol></nav>" + tail)
+
+    def _write_package(self):
+        identifier = uuid.uuid5(uuid.NAMESPACE_URL, "https://leverage.app/journal/" + self.digest.hexdigest())
+        # Same rule as the zip entries: a fixed date unless SOURCE_DATE_EPOCH
+        # pins another, so rebuilding the same journal gives the same bytes
+        epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        stamp = time.gmtime(int(epoch))[:6] if epoch else ZIP_DATE_TIME
+        modified = "%04d-%02d-%02dT%02d:%02d:%02dZ" % stamp
+        layout = ('<meta property="rendition:layout">pre-paginated</meta>\n'
+                  '<meta property="rendition:spread">auto</meta>\n') if self.layout == "fixed" else ""
+        manifest = ['<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>',
+                    '<item id="css" href="css/journal.css" media-type="text/css"/>']
+        for i, (_family, _weight, href, path) in enumerate(self.fonts, start=1):
+            media_type = FONT_MEDIA_TYPES[os.path.splitext(path)[1]]
+            manifest.append(f'<item id="font-{i}" href="{href}" media-type="{media_type}"/>')
+        spine = []
+        for i, (document, properties) in enumerate(self.items, start=1):
+            extra = f' properties="{properties}"' if properties else ""
+            manifest.append(f'<item id="d{i}" href="{document}" media-type="application/xhtml+xml"{extra}/>')
+            spine.append(f'<itemref idref="d{i}"/>')
+        self._write("OEBPS/content.opf",
+                    '<?xml version="1.0" encoding="UTF-8"?>\n'
+                    '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="book-id" '
+                    'prefix="rendition: http://www.idpf.org/vocab/rendition/#">\n'
+                    '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+                    f'<dc:identifier id="book-id">urn:uuid:{identifier}</dc:identifier>\n'
+                    '<dc:title>The Leverage Journal™</dc:title>\n'
+                    '<dc:creator>Legacy Leverage Publishing</dc:creator>\n'
+                    '<dc:language>en</dc:language>\n'
+                    f'<meta property="dcterms:modified">{modified}</meta>\n' + layout +
+                    '</metadata>\n<manifest>\n' + "\n".join(manifest) + '\n</manifest>\n'
+                    '<spine>\n' + "\n".join(spine) + '\n</spine>\n</package>\n')
+
+def write_epub(target, journal=None, layout="fixed", fonts_dir=DEFAULT_FONTS_DIR, **options):
+    """Write an EPUB of one journal to ``target``, a path or a binary file.
+
+    Pages come from ``journal`` (a ``page_model.Journal``) or from
+    ``iter_page_specs(**options)``. Paths are written to a temp file and
+    renamed into place and the file size is returned; file objects
+    (sockets, stdout) may be unseekable.
+    """
+    specs = journal.specs() if journal is not None else iter_page_specs(**options)
+    if not isinstance(target, (str, os.PathLike)):
+        with zipfile.ZipFile(target, "w") as zf:
+            EpubWriter(zf, layout, fonts_dir).write(specs)
+        return None
+    directory = os.path.dirname(os.path.abspath(target))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".journal-", suffix=".epub")
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w") as zf:
+            EpubWriter(zf, layout, fonts_dir).write(specs)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return os.path.getsize(target)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the journal as an EPUB 3 book.")
+    parser.add_argument("output", help="EPUB file, or a directory with --records")
+    parser.add_argument("--records", help="JSON-lines user records: write <output>/<user_id>.epub for each")
+    parser.add_argument("--layout", choices=LAYOUTS, default="fixed",
+                        help="fixed: one A5 page per document (default); reflowable: one document per section")
+    parser.add_argument("--fonts-dir", default=DEFAULT_FONTS_DIR, help="embed the journal fonts found here")
+    args = parser.parse_args()
+
+    if args.records:
+        os.makedirs(args.output, exist_ok=True)
+        count = 0
+        try:
+            for record in read_records(args.records):
+                write_epub(output_path(args.output, record, ".epub"), layout=args.layout,
+                           fonts_dir=args.fonts_dir, **user_options(record))
+                count += 1
+        except ValueError as exc:
+            parser.exit(1, f"❌ {exc}\n")
+        print(f"✅ Wrote {count} EPUBs → {args.output}")
+    else:
+        size = write_epub(args.output, layout=args.layout, fonts_dir=args.fonts_dir)
+        print(f"✅ EPUB ({args.layout}): {size / 1024:.1f} KB → {args.output}")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Font Subsetting
+Embeds only the glyphs a journal actually uses, cached by glyph-set hash
+"""
+
+import base64
+import hashlib
+import html
+import io
+import os
+import re
+import tempfile
+
+try:
+    from fontTools import subset
+except ImportError:  # optional: pip install fonttools (plus brotli for WOFF2)
+    subset = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FONTS_DIR = os.path.join(HERE, "fonts")
+DEFAULT_CACHE_DIR = os.path.join(HERE, "build", "font-cache")
+
+# The faces css/journal.css loads from Google Fonts: (family, weight, file stem)
+FONT_FACES = (
+    ("Cormorant Garamond", 400, "CormorantGaramond-Regular"),
+    ("Cormorant Garamond", 600, "CormorantGaramond-SemiBold"),
+    ("Cormorant Garamond", 700, "CormorantGaramond-Bold"),
+    ("Inter", 300, "Inter-Light"),
+    ("Inter", 400, "Inter-Regular"),
+    ("Inter", 500, "Inter-Medium"),
+    ("Inter", 600, "Inter-SemiBold"),
+    ("Inter", 700, "Inter-Bold"),
+)
+FONT_EXTENSIONS = (".ttf", ".otf", ".woff2", ".woff")
+
+_TAG = re.compile(r"<[^>]*>")
+# Page numbers, dates and user text can use any printable ASCII
+_ASCII = frozenset(range(0x20, 0x7F))
+
+def _text(markup):
+    return html.unescape(_TAG.sub(" ", markup))
+
+def used_codepoints(specs, registry):
+    """Code points a build can emit: template text outside tags plus every slot value.
+
+    Works from the page specs without rendering, so the result is a small
+    superset of the visible text (slot values inside attributes count too).
+    """
+    codepoints = set(_ASCII)
+    seen = set()
+    for name, values in specs:
+        if name not in seen:
+            seen.add(name)
+            codepoints.update(map(ord, _text(registry.get(name).source)))
+        for value in values.values():
+            codepoints.update(map(ord, _text(str(value))))
+    return frozenset(cp for cp in codepoints if cp >= 0x20)
+
+def glyph_set_key(codepoints):
+    return hashlib.sha256(",".join(f"{cp:x}" for cp in sorted(codepoints)).encode("ascii")).hexdigest()
+
+def find_font(fonts_dir, stem):
+    for ext in FONT_EXTENSIONS:
+        path = os.path.join(fonts_dir, stem + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+class FontSubsetter:
+    """Subset the journal fonts to a glyph set and return them as inline ``@font-face`` CSS."""
+
+    def __init__(self, fonts_dir=DEFAULT_FONTS_DIR, cache_dir=DEFAULT_CACHE_DIR):
+        if subset is None:
+            raise RuntimeError("font subsetting needs fontTools (pip install fonttools)")
+        self.fonts_dir = fonts_dir
+        self.cache_dir = cache_dir
+        self.flavor = "woff2" if brotli is not None else "woff"
+        self.faces, self.missing = [], []
+        for family, weight, stem in FONT_FACES:
+            path = find_font(fonts_dir, stem)
+            if path:
+                self.faces.append((family, weight, path))
+            else:
+                self.missing.append(stem)
+        if not self.faces:
+            raise RuntimeError(f"no journal fonts found in {fonts_dir}")
+        self._font_digests = {}
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _font_digest(self, path):
+        digest = self._font_digests.get(path)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = self._font_digests[path] = hashlib.sha256(f.read()).hexdigest()
+        return digest
+
+    def subset_font(self, path, codepoints, glyph_key=None):
+        """Return the subset font bytes for ``path``, from the cache when possible."""
+        glyph_key = glyph_key or glyph_set_key(codepoints)
+        key = f"{self._font_digest(path)}\0{self.flavor}\0{glyph_key}"
+        key = hashlib.sha256(key.encode("ascii")).hexdigest()
+        cached = os.path.join(self.cache_dir, f"{key}.{self.flavor}")
+        try:
+            with open(cached, "rb") as f:
+                self.hits += 1
+                return f.read()
+        except FileNotFoundError:
+            pass
+        self.misses += 1
+        options = subset.Options()
+        options.flavor = self.flavor
+        options.layout_features = ["*"]
+        font = subset.load_font(path, options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        buffer = io.BytesIO()
+        subset.save_font(font, buffer, options)
+        data = buffer.getvalue()
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, cached)
+        return data
+
+    def font_css(self, codepoints):
+        """A ``<style>`` block of ``@font-face`` rules with the subsets as data URIs."""
+        glyph_key = glyph_set_key(codepoints)
+        rules = []
+        for family, weight, path in self.faces:
+            data = base64.b64encode(self.subset_font(path, codepoints, glyph_key)).decode("ascii")
+            rules.append(f"@font-face{{font-family:'{family}';font-style:normal;font-weight:{weight};"
+                         f"font-display:swap;src:url(data:font/{self.flavor};base64,{data}) "
+                         f"format('{self.flavor}')}}")
+        return "<style>" + "".join(rules) + "</style>"
+
+    def report(self):
+        missing = f", missing {', '.join(self.missing)}" if self.missing else ""
+        return f"font subsets: {self.hits} cached, {self.misses} built ({self.flavor}){missing}"
@@ -1,10 +1,30 @@
 #!/usr/bin/env python3
 """
 The Leverage Journal™ - A5 Static HTML Generator
-Generates exactly 222 pages with Plan • Do • Achieve framework
+Generates the 222-page 90-day edition (or any edition length) with Plan • Do • Achieve framework
 """
 
-# Public domain quotes for rotation
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from html import escape
+
+from calendar_table import DEFAULT_LOCALE, LOCALES, calendar_table, parse_start_date
+from precompress import DEFAULT_LEVELS, SUFFIXES, PrecompressingWriter, brotli, compression_report, remove_stale
+from quotes import CorpusError, QuoteCorpus, Rotation
+from templates import REGISTRY
+
+# Public domain quotes for rotation; --quotes swaps in an external QuoteCorpus
 QUOTES = [
     {"text": "The impediment to action advances action. What stands in the way becomes the way.", "author": "Marcus Aurelius"},
     {"text": "He who has a why to live can bear almost any how.", "author": "Friedrich Nietzsche"},
@@ -53,103 +73,10 @@ WEEKLY_THEMES = [
     "Acceleration", "Resilience", "Excellence", "Dominance", "Legacy"
 ]
 
-def generate_html():
-    html = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>The Leverage Journal™ - Plan • Do • Achieve</title>
-    <link rel="stylesheet" href="css/journal.css">
-</head>
-<body>
-
-'''
-    
-    page_num = 1
-    
-    # PAGE 1: COVER
-    html += f'''<!-- PAGE {page_num:03d}: COVER -->
-<div class="page flex flex-col items-center justify-center">
-    <div class="mb-8">
-        <svg width="70" height="70" viewBox="0 0 24 24" aria-hidden="true">
-            <path fill="#FFD700" d="M12 2L15.09 8.26L22 9.27L17 14.14L18.18 21.02L12 17.77L5.82 21.02L7 14.14L2 9.27L8.91 8.26L12 2Z"/>
-        </svg>
-    </div>
-    
-    <h1 class="font-serif text-center mb-6 gold-gradient" style="font-size: 3.2em; line-height: 1.2;">
-        THE LEVERAGE<br>JOURNAL™
-    </h1>
-    
-    <div class="gold-line" style="width: 160px;"></div>
-    
-    <p class="text-xl tracking-widest mt-8 text-center uppercase" style="color: var(--gray);">Build Your Empire</p>
-    <p class="text-sm tracking-wider mt-4 gold-gradient font-semibold">Plan • Do • Achieve</p>
-    
-    <div class="qr-placeholder mt-16">
-        <svg width="110" height="110" viewBox="0 0 110 110" aria-hidden="true">
-            <rect width="110" height="110" fill="var(--black-soft)"/>
-            <text x="55" y="60" text-anchor="middle" fill="var(--gold)" opacity="0.2" font-size="12" font-family="Cormorant Garamond">SCAN</text>
-        </svg>
-    </div>
-    <p class="qr-text">Scan to unlock the app</p>
-    
-    <div style="position: absolute; bottom: 18mm; text-align: center; width: 100%;">
-        <p class="text-xs tracking-wider" style="color: var(--gray);">LEVERAGE APP © 2025</p>
-    </div>
-</div>
-
-'''
-    page_num += 1
-    
-    # PAGE 2: MY COMMITMENT
-    html += f'''<!-- PAGE {page_num:03d}: MY COMMITMENT TO SUCCESS -->
-<div class="page">
-    <div class="section-icon">
-        <svg width="50" height="50" viewBox="0 0 24 24" aria-hidden="true">
-            <path fill="#FFD700" d="M12 2L15 9L22 9L17 14L19 21L12 17L5 21L7 14L2 9L9 9L12 2Z"/>
-        </svg>
-    </div>
-    <h1 class="text-center gold-gradient" style="font-size: 1.8em;">My Commitment</h1>
-    
-    <div class="quote-box mt-8" style="font-size: 0.9em;">
-        I vow to use this journal consistently, marking the beginning of real change in my life.
-        <br><br>
-        From today, I'm choosing to push myself. I'll face challenges head-on and learn from my mistakes. Each day is a chance to get better, and I intend to make the most of it.
-        <br><br>
-        I'm going to make myself proud. Not with grand gestures, but with consistent effort and honest reflection.
-        <br><br>
-        <strong class="not-italic" style="color: var(--gold-metallic);">This is my path. My choice. My future.</strong>
-        <br><br>
-        I'm ready to put in the work.
-    </div>
-    
-    <div class="mt-12 mb-6">
-        <div class="writing-line"></div>
-        <p class="text-sm mt-2 ml-2" style="color: var(--gray);">Signature</p>
-    </div>
-    
-    <div class="mb-6">
-        <div class="writing-line"></div>
-        <p class="text-sm mt-2 ml-2" style="color: var(--gray);">Date</p>
-    </div>
-    
-    <div class="text-center mt-8">
-        <span style="font-size: 2em; filter: drop-shadow(0 0 5px var(--gold));">👑</span>
-    </div>
-    
-    <div class="footer-wisdom">Your standards define your reality. Upgrade them.</div>
-    <div class="page-number"></div>
-</div>
-
-'''
-    page_num += 1
-    
-    # PAGES 3-6: FOUNDATION PAGES
-    foundation_pages = [
-        {
-            "title": "Your Goals",
-            "content": """<h3 style="font-size: 0.85em;">SHORT TERM GOAL</h3>
+FOUNDATION_PAGES = [
+    {
+        "title": "Your Goals",
+        "content": """<h3 style="font-size: 0.85em;">SHORT TERM GOAL</h3>
     <div class="card">
         <div class="writing-line"></div>
         <div class="writing-line"></div>
@@ -173,11 +100,11 @@ def generate_html():
     <div class="quote-box mt-8 text-sm">
         Goals without deadlines are dreams. Goals without action are wishes. <strong class="not-italic" style="color: var(--gold);">Focus or stay broke.</strong>
     </div>""",
-            "wisdom": "Legacy is a daily decision. Choose it."
-        },
-        {
-            "title": "Your Vision",
-            "content": '''<p class="text-sm mb-8 text-center italic" style="color: var(--gray);">Use this section to write out your dreams and where you're heading.</p>
+        "wisdom": "Legacy is a daily decision. Choose it."
+    },
+    {
+        "title": "Your Vision",
+        "content": '''<p class="text-sm mb-8 text-center italic" style="color: var(--gray);">Use this section to write out your dreams and where you're heading.</p>
     
     <div style="height: 280px; border: 1pt solid var(--gold-dark); background: var(--black-soft); margin: 16px 0; position: relative;">
         <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); text-align: center; opacity: 0.3;">
@@ -191,11 +118,11 @@ def generate_html():
         <div class="writing-line"></div>
         <div class="writing-line"></div>
     </div>''',
-            "wisdom": "Build the vision. The money will follow."
-        },
-        {
-            "title": "My Why",
-            "content": '''<p class="text-sm mb-6 italic" style="color: var(--gray);">Remember the deeper reason behind your journey.</p>
+        "wisdom": "Build the vision. The money will follow."
+    },
+    {
+        "title": "My Why",
+        "content": '''<p class="text-sm mb-6 italic" style="color: var(--gray);">Remember the deeper reason behind your journey.</p>
     
     <h3 style="font-size: 0.85em;">What made me start this journey?</h3>
     <div class="card">
@@ -220,11 +147,11 @@ def generate_html():
         <div class="writing-line"></div>
         <div class="writing-line"></div>
     </div>''',
-            "wisdom": "Your why is your power. Never forget it."
-        },
-        {
-            "title": "My Team",
-            "content": '''<h3 style="font-size: 0.85em;">ACCOUNTABILITY PARTNER(S)</h3>
+        "wisdom": "Your why is your power. Never forget it."
+    },
+    {
+        "title": "My Team",
+        "content": '''<h3 style="font-size: 0.85em;">ACCOUNTABILITY PARTNER(S)</h3>
     <p class="text-sm mb-3" style="color: var(--gray);">The person/people who will hold me accountable</p>
     <div class="card">
         <div class="writing-line"></div>
@@ -247,11 +174,11 @@ def generate_html():
         <div class="writing-line"></div>
         <div class="writing-line"></div>
     </div>''',
-            "wisdom": "Surround yourself with builders, not talkers."
-        },
-        {
-            "title": "Imprint",
-            "content": '''<div class="text-center mt-16">
+        "wisdom": "Surround yourself with builders, not talkers."
+    },
+    {
+        "title": "Imprint",
+        "content": '''<div class="text-center mt-16">
         <h2 class="gold-gradient mb-8" style="font-size: 1.4em;">The Leverage Journal™</h2>
         <p class="text-sm mb-3" style="color: var(--gray);">Plan • Do • Achieve</p>
         
@@ -270,521 +197,742 @@ def generate_html():
             Consult professionals for specific advice.
         </p>
     </div>''',
-            "wisdom": "Legacy is a daily decision. Choose it."
-        }
-    ]
-    
-    for page_data in foundation_pages:
-        html += f'''<!-- PAGE {page_num:03d}: {page_data["title"].upper()} -->
-<div class="page">
-    <h1 class="text-center gold-gradient" style="font-size: 1.8em;">{page_data["title"]}</h1>
-    <div class="gold-line"></div>
-    
-    {page_data["content"]}
-    
-    <div class="footer-wisdom">{page_data["wisdom"]}</div>
-    <div class="page-number"></div>
-</div>
+        "wisdom": "Legacy is a daily decision. Choose it."
+    }
+]
 
-'''
-        page_num += 1
-    
-    # PAGE 7: PLAN SECTION DIVIDER
-    html += f'''<!-- PAGE {page_num:03d}: PLAN SECTION DIVIDER -->
-<div class="page">
-    <div class="section-divider">
-        <div class="font-serif" style="font-size: 5em; opacity: 0.08; color: var(--gold); margin-bottom: 16px;">01</div>
-        <div class="icon-gold mb-12">
-            <svg width="60" height="60" viewBox="0 0 24 24" aria-hidden="true">
-                <circle cx="12" cy="12" r="10" stroke="#FFD700" stroke-width="1.5" fill="none"/>
-                <path fill="#FFD700" d="M12 6L12 12L16 14"/>
-            </svg>
-        </div>
-        <h1 class="section-title gold-gradient" style="font-size: 2.4em;">PLAN</h1>
-        <div class="gold-line" style="width: 160px; margin: 24px auto;"></div>
-        <p class="section-subtitle">Strategy turns ideas into reality</p>
-        
-        <div class="qr-placeholder mt-16" style="width: 120px; height: 120px;">
-            <svg width="100" height="100" viewBox="0 0 100 100" aria-hidden="true">
-                <rect width="100" height="100" fill="var(--black-soft)"/>
-                <text x="50" y="55" text-anchor="middle" fill="var(--gold)" opacity="0.2" font-size="10">PLAN</text>
-            </svg>
-        </div>
-        <p class="qr-text">Access planning templates</p>
-    </div>
-</div>
+# Section each page template belongs to; dividers open the section they introduce
+TEMPLATE_SECTIONS = {
+    "document_head": "cover",
+    "cover": "cover",
+    "commitment": "commitment",
+    "foundation": "foundation",
+    "plan_divider": "goals",
+    "goal_breakdown": "goals",
+    "goal_tasks": "goals",
+    "goal_breakdown_entry": "goals",
+    "goal_tasks_entry": "goals",
+    "do_divider": "days",
+    "day": "days",
+    "day_achieve": "days",
+    "day_entry": "days",
+    "day_achieve_entry": "days",
+    "achieve_divider": "weeks",
+    "week_review": "weeks",
+    "week_review_entry": "weeks",
+    "victory_divider": "closing",
+    "you_did_it": "closing",
+    "notes": "closing",
+    "legacy_message": "closing",
+    "document_tail": "closing",
+}
 
-'''
-    page_num += 1
-    
-    # PAGES 8-23: 8 GOALS × 2 PAGES = 16 PAGES
-    for goal_num in range(1, 9):
-        # Goal Planning Page
-        html += f'''<!-- PAGE {page_num:03d}: GOAL {goal_num} BREAKDOWN -->
-<div class="page">
-    <h2 class="text-center gold-gradient mb-6" style="font-size: 1.4em;">GOAL BREAKDOWN {goal_num}</h2>
-    <div class="gold-line"></div>
-    
-    <div class="priority-item" style="background: var(--black-soft); border: 1pt solid var(--gold-dark);">
-        <div class="checkbox"></div>
-        <div class="flex-1">
-            <h3 class="text-lg mb-3" style="font-size: 0.95em;">GOAL</h3>
-            <div class="writing-line"></div>
-        </div>
-    </div>
-    
-    <h3 class="mt-6" style="font-size: 0.85em;">CATEGORY</h3>
-    <div class="flex gap-3 text-sm mt-2" style="flex-wrap: wrap;">
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{goal_num}"> Work</label>
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{goal_num}"> Health</label>
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{goal_num}"> Financial</label>
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{goal_num}"> Growth</label>
-    </div>
-    
-    <h3 class="mt-6" style="font-size: 0.85em;">COMPLETE BY</h3>
-    <div class="flex gap-3 text-sm mt-2" style="flex-wrap: wrap;">
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{goal_num}"> This Week</label>
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{goal_num}"> This Month</label>
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{goal_num}"> This Year</label>
-    </div>
+SECTIONS = ("cover", "commitment", "foundation", "goals", "days", "weeks", "closing")
+
+# Edition length: the standard journal is 90 daily spreads, reviewed weekly
+DEFAULT_DAYS = 90
+DAYS_PER_WEEK = 7
+
+# Named build variants: each maps to keyword options for iter_page_specs
+VARIANTS = {
+    "standard": {},
+    "30-day": {"days": 30},
+    "60-day": {"days": 60},
+    "180-day": {"days": 180},
+    "365-day": {"days": 365},
+}
+
+BLANK_DATE = "___/___/___"
+# Undated grid-tracker columns; dated editions start on the first day's weekday
+BLANK_WEEKDAYS = {f"weekday_{i}": initial for i, initial in enumerate("MTWTFSS", start=1)}
+
+def index_entries(entries):
+    """Key journal_entries rows by day number.
+
+    Accepts either the ``entriesByDay`` mapping returned by
+    ``/api/journal/generate`` (string or int keys) or an iterable of rows
+    carrying ``day_number``.
+    """
+    if not entries:
+        return {}
+    if isinstance(entries, dict):
+        return {int(day): row for day, row in entries.items() if row}
+    return {int(row["day_number"]): row for row in entries if row.get("day_number")}
+
+def _entry_lines(text, count):
+    lines = [line.strip() for line in (text or "").splitlines() if line.strip()][:count]
+    return [escape(line) for line in lines] + [""] * (count - len(lines))
+
+def _entry_date(value):
+    if not value:
+        return BLANK_DATE
+    try:
+        return date.fromisoformat(str(value)[:10]).strftime("%m/%d/%Y")
+    except ValueError:
+        return escape(str(value))
+
+def day_entry_values(entry, calendar_date=None):
+    """Map one journal_entries row onto the day_entry and day_achieve_entry slots.
+
+    ``calendar_date`` is the day's label in a dated edition; it replaces
+    the row's ``entry_date`` so the page matches the edition's locale.
+    """
+    tasks = [task for task in (entry.get("tasks") or []) if isinstance(task, dict) and task.get("text")]
+    wins = [("✓ " if task.get("completed") else "") + task["text"] for task in tasks]
+    achieved = [task["text"] for task in tasks if task.get("completed")]
+    priorities = [escape(entry.get(f"priority_{i}") or "") for i in (1, 2, 3)]
+    when = calendar_date or _entry_date(entry.get("entry_date"))
+    mood = entry.get("mood")
+    
+    left = {
+        "date": when,
+        "gratitude": _entry_lines(entry.get("gratitude"), 1)[0],
+        "primary_goal": priorities[0],
+        "priority_1": priorities[0],
+        "priority_2": priorities[1],
+        "priority_3": priorities[2],
+    }
+    left.update(zip(("win_1", "win_2", "win_3"), _entry_lines("\n".join(wins), 3)))
+    right = {
+        "date": when,
+        "mood": f" • {escape(mood).upper()}" if mood else "",
+    }
+    right.update(zip(("achieved_1", "achieved_2", "achieved_3"), _entry_lines("\n".join(achieved), 3)))
+    right.update(zip(("lesson_1", "lesson_2"), _entry_lines(entry.get("reflection"), 2)))
+    return left, right
+
+def index_reviews(reviews):
+    """Key weekly_reviews rows by week number (mapping or iterable of rows)."""
+    if not reviews:
+        return {}
+    if isinstance(reviews, dict):
+        return {int(week): row for week, row in reviews.items() if row}
+    return {int(row["week_number"]): row for row in reviews if row.get("week_number")}
+
+def index_goals(goals):
+    """Assign active goals rows, in the order given, to goal pages 1-8."""
+    active = [row for row in (goals or []) if row.get("status", "active") == "active"]
+    return dict(enumerate(active[:8], start=1))
+
+def goal_values(goal):
+    """Map one goals row onto the goal_breakdown_entry and goal_tasks_entry slots."""
+    category = (goal.get("category") or "").strip().lower()
+    milestones = [m for m in (goal.get("milestones") or []) if isinstance(m, dict) and m.get("title")]
+    tasks = [("✓ " if m.get("completed") else "") + m["title"] for m in milestones]
+    
+    breakdown = {"title": escape(goal.get("title") or "")}
+    for name in ("work", "health", "financial", "growth"):
+        breakdown[f"cat_{name}"] = " checked" if category == name else ""
+    breakdown.update(zip(("why_1", "why_2"), _entry_lines(goal.get("why"), 2)))
+    breakdown.update(zip(("plan_1", "plan_2"), _entry_lines(goal.get("how") or goal.get("description"), 2)))
+    
+    task_page = {
+        "reached": "_______________",
+        "reward": _entry_lines(goal.get("reward"), 1)[0],
+    }
+    if goal.get("status") == "completed" and goal.get("updated_at"):
+        task_page["reached"] = _entry_date(goal["updated_at"])
+    task_page.update(zip((f"task_{i}" for i in range(1, 9)), _entry_lines("\n".join(tasks), 8)))
+    return breakdown, task_page
+
+def review_values(review):
+    """Map one weekly_reviews row onto the week_review_entry slots."""
+    values = {}
+    values.update(zip(("win_1", "win_2", "win_3"), _entry_lines(review.get("wins"), 3)))
+    values.update(zip(("challenge_1", "challenge_2", "challenge_3"), _entry_lines(review.get("obstacles"), 3)))
+    values.update(zip(("next_1", "next_2"), _entry_lines(review.get("next_steps"), 2)))
+    return values
+
+def iter_page_specs(entries=None, reviews=None, goals=None, days=DEFAULT_DAYS, start_date=None,
+                    locale=DEFAULT_LOCALE, quotes=None, wisdom=None, quote_seed=None):
+    """Yield ``(template_name, slot_values)`` for the head, every page and the tail.
+
+    ``entries``, ``reviews`` and ``goals`` optionally carry a user's
+    journal_entries, weekly_reviews and goals rows; the matching Day,
+    Week and Goal pages are rendered with the user's own content instead
+    of blank lines. ``days`` sets the edition length: one two-page spread
+    per day and one review per started week, with the weekly themes
+    repeating for editions longer than 13 weeks.
+
+    ``start_date`` (a ``date`` or ``YYYY-MM-DD``) makes a dated edition:
+    day pages, weekly reviews and grid-tracker headers are filled from a
+    ``CalendarTable`` for ``locale`` that is built once and shared by
+    every build with the same start, length and locale.
+
+    ``quotes`` and ``wisdom`` replace ``QUOTES`` and ``FOOTER_WISDOM``
+    with any indexable sequence, typically a ``QuoteCorpus``; only the
+    records that land on a page are read. ``quote_seed`` (per user or per
+    edition) picks a deterministic rotation instead of day order.
+    """
+    if isinstance(days, bool) or not isinstance(days, int) or days < 1:
+        raise ValueError(f"days must be a positive whole number, not {days!r}")
+    weeks = -(-days // DAYS_PER_WEEK)
+    calendar = calendar_table(start_date, days, locale, DAYS_PER_WEEK) if start_date else None
+    quotes = QUOTES if quotes is None else quotes
+    wisdom = FOOTER_WISDOM if wisdom is None else wisdom
+    quote_order = Rotation(len(quotes), quote_seed)
+    wisdom_order = Rotation(len(wisdom), quote_seed)
+    entries = index_entries(entries)
+    reviews = index_reviews(reviews)
+    goals = index_goals(goals)
+    yield "document_head", {}
     
-    <h3 class="mt-6" style="font-size: 0.85em;">WHY DO I WANT IT?</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
+    page_num = 1
     
-    <h3 class="mt-4" style="font-size: 0.85em;">OBSTACLES I MIGHT FACE</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
+    # PAGE 1: COVER
+    yield "cover", {"page": f"{page_num:03d}"}
+    page_num += 1
     
-    <h3 class="mt-4" style="font-size: 0.85em;">MY ACTION PLAN</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
+    # PAGE 2: MY COMMITMENT
+    yield "commitment", {"page": f"{page_num:03d}"}
+    page_num += 1
     
-    <div class="footer-wisdom">Execution beats intention every time.</div>
-    <div class="page-number"></div>
-</div>
-
-'''
+    # PAGES 3-7: FOUNDATION PAGES
+    for page_data in FOUNDATION_PAGES:
+        yield "foundation", {
+            "page": f"{page_num:03d}",
+            "label": page_data["title"].upper(),
+            "title": page_data["title"],
+            "content": page_data["content"],
+            "wisdom": page_data["wisdom"],
+        }
         page_num += 1
-        
-        # Goal Tasks Page
-        html += f'''<!-- PAGE {page_num:03d}: GOAL {goal_num} TASKS -->
-<div class="page">
-    <h2 class="text-center gold-gradient mb-4" style="font-size: 1.3em;">TASKS TO COMPLETE</h2>
-    <p class="text-center text-sm mb-6" style="color: var(--gray);">To reach goal {goal_num}</p>
-    <div class="gold-line"></div>
-    
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    <div class="priority-item">
-        <div class="checkbox"></div>
-        <div class="writing-line flex-1"></div>
-    </div>
-    
-    <div class="card mt-6" style="background: linear-gradient(135deg, var(--black-soft), var(--gold-dark)); border: 1.5pt solid var(--gold); text-align: center; padding: 14px;">
-        <h3 class="text-lg mb-3" style="font-size: 0.95em;">✅ GOAL REACHED</h3>
-        <p class="text-sm" style="color: var(--gray);">Date: _______________</p>
-    </div>
     
-    <h3 class="mt-4" style="font-size: 0.85em;">🎁 REWARD</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-    </div>
+    # PAGE 8: PLAN SECTION DIVIDER
+    yield "plan_divider", {"page": f"{page_num:03d}"}
+    page_num += 1
     
-    <div class="footer-wisdom">Small wins compound into massive victories.</div>
-    <div class="page-number"></div>
-</div>
-
-'''
+    # PAGES 9-24: 8 GOALS × 2 PAGES = 16 PAGES
+    for goal_num in range(1, 9):
+        goal = goals.get(goal_num)
+        if goal is not None:
+            breakdown, task_page = goal_values(goal)
+            yield "goal_breakdown_entry", {"page": f"{page_num:03d}", "goal": goal_num, **breakdown}
+            page_num += 1
+            yield "goal_tasks_entry", {"page": f"{page_num:03d}", "goal": goal_num, **task_page}
+            page_num += 1
+            continue
+        yield "goal_breakdown", {"page": f"{page_num:03d}", "goal": goal_num}
+        page_num += 1
+        yield "goal_tasks", {"page": f"{page_num:03d}", "goal": goal_num}
         page_num += 1
     
-    # PAGE 24: DO SECTION DIVIDER
-    html += f'''<!-- PAGE {page_num:03d}: DO SECTION DIVIDER -->
-<div class="page">
-    <div class="section-divider">
-        <div class="font-serif" style="font-size: 5em; opacity: 0.08; color: var(--gold); margin-bottom: 16px;">02</div>
-        <div class="icon-gold mb-12">
-            <svg width="60" height="60" viewBox="0 0 24 24" aria-hidden="true">
-                <path fill="#FFD700" d="M12 2L14 8H20L15 12L17 18L12 14L7 18L9 12L4 8H10L12 2Z"/>
-            </svg>
-        </div>
-        <h1 class="section-title gold-gradient" style="font-size: 2.4em;">DO</h1>
-        <div class="gold-line" style="width: 160px; margin: 24px auto;"></div>
-        <p class="section-subtitle">Action is the bridge between<br>potential and success</p>
-        
-        <div class="qr-placeholder mt-16" style="width: 120px; height: 120px;">
-            <svg width="100" height="100" viewBox="0 0 100 100" aria-hidden="true">
-                <rect width="100" height="100" fill="var(--black-soft)"/>
-                <text x="50" y="55" text-anchor="middle" fill="var(--gold)" opacity="0.2" font-size="10">DO</text>
-            </svg>
-        </div>
-        <p class="qr-text">Day mission audio</p>
-    </div>
-</div>
-
-'''
+    # PAGE 25: DO SECTION DIVIDER
+    yield "do_divider", {"page": f"{page_num:03d}"}
     page_num += 1
     
-    # PAGES 25-204: 90 DAILY SPREADS (180 PAGES)
-    for day in range(1, 91):
-        quote = QUOTES[day % len(QUOTES)]
-        wisdom = FOOTER_WISDOM[day % len(FOOTER_WISDOM)]
+    # PAGES 26-205: 90 DAILY SPREADS (180 PAGES) IN THE STANDARD EDITION
+    for day in range(1, days + 1):
+        quote = quotes[quote_order[day]]
+        if isinstance(quote, str):
+            quote = {"text": quote}
+        quote_text = escape(quote["text"], quote=False)
+        quote_author = escape(quote.get("author", ""), quote=False).upper()
+        footer = wisdom[wisdom_order[day]]
+        footer = escape(footer if isinstance(footer, str) else footer["text"], quote=False)
         
-        # Day Page (left)
-        html += f'''<!-- PAGE {page_num:03d}: DAY {day} -->
-<div class="page">
-    <div class="flex justify-between items-center mb-4" style="font-size: 0.85em;">
-        <div style="color: var(--gray); letter-spacing: 1px;">DAY {day}</div>
-        <div style="color: var(--gray);">___/___/___</div>
-    </div>
-    
-    <div class="quote-box text-sm">
-        {quote["text"]}
-        <div class="quote-author">— {quote["author"].upper()}</div>
-    </div>
-    
-    <h3 style="font-size: 0.85em;">TODAY I AM GRATEFUL FOR...</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-    </div>
-    
-    <h3 class="mt-4" style="font-size: 0.85em;">TODAY'S PRIMARY GOAL</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-    </div>
-    
-    <div class="grid grid-cols-2 gap-4 mt-6">
-        <div>
-            <h3 class="text-sm" style="font-size: 0.8em;">TOP 3 PRIORITIES</h3>
-            <div class="priority-item">
-                <div class="checkbox"></div>
-                <div class="writing-line flex-1"></div>
-            </div>
-            <div class="priority-item">
-                <div class="checkbox"></div>
-                <div class="writing-line flex-1"></div>
-            </div>
-            <div class="priority-item">
-                <div class="checkbox"></div>
-                <div class="writing-line flex-1"></div>
-            </div>
-        </div>
+        when = calendar.day_dates[day - 1] if calendar else None
+        entry = entries.get(day)
+        if entry is not None:
+            left, right = day_entry_values(entry, when)
+            yield "day_entry", {
+                "page": f"{page_num:03d}",
+                "day": day,
+                "quote_text": quote_text,
+                "quote_author": quote_author,
+                "wisdom": footer,
+                **left,
+            }
+            page_num += 1
+            yield "day_achieve_entry", {"page": f"{page_num:03d}", "day": day, **right}
+            page_num += 1
+            continue
         
-        <div>
-            <h3 class="text-sm" style="font-size: 0.8em;">3 WINS I'M CREATING</h3>
-            <div class="card">
-                <div class="writing-line"></div>
-                <div class="writing-line"></div>
-                <div class="writing-line"></div>
-            </div>
-        </div>
-    </div>
-    
-    <h3 class="mt-6" style="font-size: 0.85em;">💪 WORKOUT</h3>
-    <div class="flex gap-3 text-sm mt-2">
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Cardio</label>
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Weights</label>
-        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Rest</label>
-    </div>
-    
-    <div class="footer-wisdom">{wisdom}</div>
-    <div class="page-number"></div>
-</div>
-
-'''
+        # Day Page (left)
+        yield "day", {
+            "page": f"{page_num:03d}",
+            "day": day,
+            "quote_text": quote_text,
+            "quote_author": quote_author,
+            "wisdom": footer,
+            "date": when or BLANK_DATE,
+        }
         page_num += 1
         
         # Achieve Page (right)
-        html += f'''<!-- PAGE {page_num:03d}: DAY {day} ACHIEVE -->
-<div class="page">
-    <div class="flex justify-between items-center mb-4" style="font-size: 0.85em;">
-        <div style="color: var(--gray); letter-spacing: 1px;">DAY {day} • ACHIEVE</div>
-        <div style="color: var(--gray);">___/___/___</div>
-    </div>
-    
-    <h2 class="text-center gold-gradient mb-6" style="font-size: 1.4em;">Daily Achieve</h2>
-    <div class="gold-line"></div>
-    
-    <div class="grid grid-cols-2 gap-4 mt-4">
-        <div class="card">
-            <h3 class="text-sm card-header" style="font-size: 0.8em;">✅ WHAT I ACHIEVED</h3>
-            <div class="writing-line"></div>
-            <div class="writing-line"></div>
-            <div class="writing-line"></div>
-        </div>
-        
-        <div class="card">
-            <h3 class="text-sm card-header" style="font-size: 0.8em;">📈 HOW I CAN IMPROVE</h3>
-            <div class="writing-line"></div>
-            <div class="writing-line"></div>
-            <div class="writing-line"></div>
-        </div>
-    </div>
-    
-    <h3 class="mt-6" style="font-size: 0.85em;">🏆 WINS TODAY</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
-    
-    <h3 class="mt-4" style="font-size: 0.85em;">💡 LESSONS LEARNED</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
-    
-    <h3 class="mt-4" style="font-size: 0.85em;">🎯 TOMORROW I WILL...</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-    </div>
-    
-    <div class="text-center mt-6">
-        <span style="font-size: 2em; filter: drop-shadow(0 0 5px var(--gold));">⚔️</span>
-    </div>
-    
-    <div class="footer-wisdom">Reflection is where growth happens.</div>
-    <div class="page-number"></div>
-</div>
-
-'''
+        yield "day_achieve", {"page": f"{page_num:03d}", "day": day, "date": when or BLANK_DATE}
         page_num += 1
     
-    # PAGE 205: ACHIEVE SECTION DIVIDER
-    html += f'''<!-- PAGE {page_num:03d}: ACHIEVE SECTION DIVIDER -->
-<div class="page">
-    <div class="section-divider">
-        <div class="font-serif" style="font-size: 5em; opacity: 0.08; color: var(--gold); margin-bottom: 16px;">03</div>
-        <div class="icon-gold mb-12">
-            <svg width="60" height="60" viewBox="0 0 24 24" aria-hidden="true">
-                <path fill="#FFD700" d="M12 2L15 8L22 9L17 14L18 21L12 18L6 21L7 14L2 9L9 8L12 2Z"/>
-            </svg>
-        </div>
-        <h1 class="section-title gold-gradient" style="font-size: 2.4em;">ACHIEVE</h1>
-        <div class="gold-line" style="width: 160px; margin: 24px auto;"></div>
-        <p class="section-subtitle">Measured growth is mastery</p>
-        
-        <div class="qr-placeholder mt-16" style="width: 120px; height: 120px;">
-            <svg width="100" height="100" viewBox="0 0 100 100" aria-hidden="true">
-                <rect width="100" height="100" fill="var(--black-soft)"/>
-                <text x="50" y="55" text-anchor="middle" fill="var(--gold)" opacity="0.2" font-size="9">ACHIEVE</text>
-            </svg>
-        </div>
-        <p class="qr-text">Weekly insights</p>
-    </div>
-</div>
-
-'''
+    # PAGE 206: ACHIEVE SECTION DIVIDER
+    yield "achieve_divider", {"page": f"{page_num:03d}"}
     page_num += 1
     
-    # PAGES 206-218: 13 WEEKLY ACHIEVE REVIEWS
-    for week in range(1, 14):
-        theme = WEEKLY_THEMES[week - 1]
-        html += f'''<!-- PAGE {page_num:03d}: WEEK {week} ACHIEVE REVIEW -->
-<div class="page">
-    <h1 class="text-center gold-gradient mb-3" style="font-size: 1.6em;">Weekly Achieve</h1>
-    <h2 class="text-center mb-2" style="color: var(--gold-metallic); font-size: 1.2em;">WEEK {week}</h2>
-    <p class="text-center text-sm mb-6 tracking-widest uppercase" style="color: var(--gray);">{theme}</p>
-    <div class="gold-line"></div>
-    
-    <h3 class="mt-6" style="font-size: 0.85em;">📊 HABIT TRACKER</h3>
-    <div class="grid-tracker">
-        <div class="grid-cell text-xs font-bold">M</div>
-        <div class="grid-cell text-xs font-bold">T</div>
-        <div class="grid-cell text-xs font-bold">W</div>
-        <div class="grid-cell text-xs font-bold">T</div>
-        <div class="grid-cell text-xs font-bold">F</div>
-        <div class="grid-cell text-xs font-bold">S</div>
-        <div class="grid-cell text-xs font-bold">S</div>
-        {"".join(['<div class="grid-cell"></div>' for _ in range(21)])}
-    </div>
-    
-    <h3 class="mt-6" style="font-size: 0.85em;">⭐ TOP 3 WINS</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
-    
-    <h3 class="mt-4" style="font-size: 0.85em;">⚠️ TOP 3 CHALLENGES</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
-    
-    <h3 class="mt-4" style="font-size: 0.85em;">🎯 GOALS FOR NEXT WEEK</h3>
-    <div class="card">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
-    
-    <div class="card mt-6 text-center" style="background: linear-gradient(135deg, var(--black-soft), var(--gold-dark)); border: 1.5pt solid var(--gold); padding: 12px;">
-        <h3 style="font-size: 1.1em;">WEEK RATING: <span style="font-size: 1.5em; margin-left: 10px;">___ / 10</span></h3>
-    </div>
+    # PAGES 207-219: 13 WEEKLY ACHIEVE REVIEWS IN THE STANDARD EDITION
+    for week in range(1, weeks + 1):
+        theme = WEEKLY_THEMES[(week - 1) % len(WEEKLY_THEMES)]
+        if calendar:
+            dated = {"dates": f" • {calendar.week_ranges[week - 1]}", **calendar.week_headers[week - 1]}
+        else:
+            dated = {"dates": "", **BLANK_WEEKDAYS}
+        review = reviews.get(week)
+        if review is not None:
+            yield "week_review_entry", {"page": f"{page_num:03d}", "week": week, "theme": theme,
+                                        **dated, **review_values(review)}
+        else:
+            yield "week_review", {"page": f"{page_num:03d}", "week": week, "theme": theme, **dated}
+        page_num += 1
     
-    <div class="footer-wisdom">Progress is the only metric that matters.</div>
-    <div class="page-number"></div>
-</div>
-
-'''
+    # CLOSING PAGES: VICTORY, YOU DID IT, NOTES, LEGACY MESSAGE
+    for name in ("victory_divider", "you_did_it", "notes", "legacy_message"):
+        yield name, {"page": f"{page_num:03d}"}
         page_num += 1
     
-    # PAGE 219: VICTORY DIVIDER
-    html += f'''<!-- PAGE {page_num:03d}: VICTORY DIVIDER -->
-<div class="page">
-    <div class="section-divider" style="padding-top: 60px;">
-        <div class="icon-gold mb-12" style="font-size: 4em;">
-            <svg width="80" height="80" viewBox="0 0 24 24" aria-hidden="true">
-                <path fill="#FFD700" d="M12 2L15 9L22 9L17 14L19 21L12 17L5 21L7 14L2 9L9 9L12 2Z"/>
-            </svg>
-        </div>
-        <h1 class="gold-gradient" style="font-size: 3em; letter-spacing: 8px;">VICTORY</h1>
-        <div class="gold-line" style="width: 200px; margin: 24px auto;"></div>
-    </div>
-</div>
+    # Close HTML
+    yield "document_tail", {}
 
-'''
-    page_num += 1
-    
-    # PAGE 220: YOU DID IT
-    html += f'''<!-- PAGE {page_num:03d}: YOU DID IT -->
-<div class="page">
-    <div class="section-divider" style="padding-top: 50px;">
-        <div class="icon-gold mb-8" style="font-size: 4.5em;">👑</div>
-        <h1 class="gold-gradient mb-6" style="font-size: 3.2em; letter-spacing: 8px;">YOU DID IT</h1>
-        <div class="gold-line" style="width: 200px; margin: 24px auto;"></div>
-        
-        <p class="text-2xl mt-8 tracking-widest" style="color: var(--gray);">DISCIPLINE • GROWTH • MASTERY</p>
-        
-        <div class="quote-box mt-12 text-sm" style="max-width: 90%; margin-left: auto; margin-right: auto;">
-            The credit belongs to the man who is actually in the arena, whose face is marred by dust and sweat and blood; who strives valiantly; who errs, who comes short again and again, because there is no effort without error and shortcoming.
-            <div class="quote-author">— THEODORE ROOSEVELT</div>
-        </div>
-        
-        <p class="text-3xl font-bold gold-gradient mt-12" style="letter-spacing: 3px;">NOW GO BUILD<br>YOUR EMPIRE</p>
-        
-        <div class="qr-placeholder mt-12" style="width: 140px; height: 140px;">
-            <svg width="120" height="120" viewBox="0 0 120 120" aria-hidden="true">
-                <rect width="120" height="120" fill="var(--black-soft)"/>
-                <text x="60" y="65" text-anchor="middle" fill="var(--gold)" opacity="0.2" font-size="11">GUILD</text>
-            </svg>
-        </div>
-        <p class="qr-text">Join the Builder's Guild</p>
-    </div>
-</div>
+# A page renders in about 3 us, while a process pool costs ~8 ms to start
+# and ~4 us per page to pickle specs out and markup back, so the pool only
+# wins on jobs far longer than any edition (the 365-day one is 815 pages)
+PARALLEL_MIN_PAGES = 4096
+CHUNK_MAX_PAGES = 32
+# Rendered chunks queued per worker before the reader catches up
+PARALLEL_WINDOW = 2
+STYLESHEET_LINK = '<link rel="stylesheet" href="css/journal.css">'
 
-'''
-    page_num += 1
-    
-    # PAGE 221: NOTES
-    html += f'''<!-- PAGE {page_num:03d}: NOTES -->
-<div class="page">
-    <h1 class="text-center gold-gradient mb-6" style="font-size: 1.8em;">Notes</h1>
-    <div class="gold-line"></div>
-    
-    <div class="card" style="min-height: 450px;">
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-        <div class="writing-line"></div>
-    </div>
-    
-    <div class="footer-wisdom">Write the next chapter.</div>
-    <div class="page-number"></div>
-</div>
+# --minify modes: keep the PAGE NNN markers (incremental splicing and page
+# diffs rely on them) or drop every comment
+MINIFY_MODES = ("keep-markers", "drop-markers")
 
-'''
-    page_num += 1
-    
-    # PAGE 222: LEGACY MESSAGE
-    html += f'''<!-- PAGE {page_num:03d}: ACKNOWLEDGEMENTS / LEGACY MESSAGE -->
-<div class="page">
-    <h1 class="text-center gold-gradient mb-6" style="font-size: 1.8em;">Legacy Message</h1>
-    <div class="gold-line"></div>
-    
-    <div class="quote-box mt-8 text-sm">
-        You've completed this journey. But completion is not the end—it's proof that you can commit, execute, and achieve.
-        <br><br>
-        Every page you filled was a vote for the person you're becoming. Every goal you set was a declaration of your standards. Every reflection was an investment in your growth.
-        <br><br>
-        <strong class="not-italic" style="color: var(--gold-metallic);">This is not where it ends. This is where it begins.</strong>
-        <br><br>
-        The system works because you worked it. The journal succeeded because you showed up. Now take everything you've learned and build something that lasts.
-    </div>
-    
-    <div class="card mt-12" style="background: linear-gradient(135deg, var(--gold-dark), var(--black-soft)); border: 1.5pt solid var(--gold); padding: 20px; text-align: center;">
-        <h3 style="font-size: 1.2em; color: var(--white);">Your legacy awaits.</h3>
-        <p class="mt-4 text-sm" style="color: var(--white);">Start the next journal. Join the community. Build your empire.</p>
-    </div>
-    
-    <div class="text-center mt-12">
-        <span style="font-size: 3em; filter: drop-shadow(0 0 8px var(--gold));">👑</span>
-    </div>
-    
-    <div style="position: absolute; bottom: 18mm; text-align: center; width: 100%;">
-        <p class="text-xs tracking-wider" style="color: var(--gray);">LEVERAGE APP © 2025</p>
-        <p class="text-xs mt-2" style="color: var(--gold-dark);">Built for empire builders</p>
-    </div>
-    
-    <div class="page-number"></div>
-</div>
+@lru_cache(maxsize=None)
+def registry_for(minify=None):
+    """The template registry for a ``minify`` mode; minified copies are built once per process."""
+    if minify is None:
+        return REGISTRY
+    if minify not in MINIFY_MODES:
+        raise ValueError(f"unknown minify mode {minify!r}")
+    from minify import minify_registry
+    usage = {}
+    for name, _values in iter_page_specs():
+        usage[name] = usage.get(name, 0) + 1
+    return minify_registry(REGISTRY, usage, drop_markers=minify == "drop-markers")
 
-'''
-    
-    # Close HTML
-    html += '''</body>
-</html>'''
-    
-    return html
+def render_chunk(specs, minify=None):
+    """Process-pool worker: render a run of consecutive page specs."""
+    get = registry_for(minify).get
+    return "".join(get(name).render(**values) for name, values in specs)
+
+def chunk_specs(specs, workers):
+    """Split a spec list into about four runs of consecutive pages per worker.
+
+    Runs are capped at ``CHUNK_MAX_PAGES`` so long editions get more
+    chunks rather than larger ones.
+    """
+    size = min(max(1, -(-len(specs) // (workers * 4))), CHUNK_MAX_PAGES)
+    return [specs[i:i + size] for i in range(0, len(specs), size)]
+
+def _iter_pages_parallel(specs, workers, minify=None):
+    chunks = iter(chunk_specs(specs, workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep only a couple of chunks per worker in flight, so rendered
+        # markup waiting for a slow reader stays bounded for long editions.
+        futures = deque(pool.submit(render_chunk, chunk, minify)
+                        for chunk in islice(chunks, workers * PARALLEL_WINDOW))
+        # Results are consumed in submission order, so pages stay in page order.
+        while futures:
+            markup = futures.popleft().result()
+            for chunk in islice(chunks, 1):
+                futures.append(pool.submit(render_chunk, chunk, minify))
+            yield markup
+
+def parse_page_range(text):
+    """Parse ``"1-30,205"`` into the set of page numbers it names."""
+    pages = set()
+    for part in text.split(","):
+        first, sep, last = part.strip().partition("-")
+        try:
+            lo = int(first)
+            hi = int(last) if sep else lo
+        except ValueError:
+            raise ValueError(f"invalid page range {part.strip()!r}") from None
+        if lo < 1 or hi < lo:
+            raise ValueError(f"invalid page range {part.strip()!r}")
+        pages.update(range(lo, hi + 1))
+    return frozenset(pages)
+
+def select_pages(specs, pages):
+    """Keep the document head/tail and only the numbered pages in ``pages``."""
+    for name, values in specs:
+        page = values.get("page")
+        if page is None or int(page) in pages:
+            yield name, values
+
+def count_pages(**options):
+    """Number of numbered pages a build with these options produces."""
+    return sum(1 for _name, values in iter_page_specs(**options) if "page" in values)
+
+def _iter_pages_instrumented(specs, collector, registry):
+    get = registry.get
+    clock = time.perf_counter
+    tracing = tracemalloc.is_tracing()
+    specs = iter(specs)
+    while True:
+        # Building the slot values is part of each page's cost, so the
+        # clock starts before the spec is pulled from the generator
+        allocated_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = clock()
+        try:
+            name, values = next(specs)
+        except StopIteration:
+            return
+        built = clock()
+        markup = get(name).render(**values)
+        end = clock()
+        collector({
+            "template": name,
+            "section": TEMPLATE_SECTIONS.get(name, name),
+            "page": values.get("page"),
+            "start": start,
+            "seconds": end - start,
+            "build_seconds": built - start,
+            "bytes": len(markup.encode("utf-8")),
+            "allocated": tracemalloc.get_traced_memory()[0] - allocated_before if tracing else None,
+        })
+        yield markup
+
+def iter_pages(workers=None, collector=None, pages=None, minify=None, head_extra=None,
+               inline_css=None, journal=None, **options):
+    """Yield the document head, then each page as it is rendered, then the tail.
+
+    With ``workers`` > 1 the pages are rendered in chunks on a process pool
+    and yielded one chunk at a time in page order; ``workers`` is capped at
+    the CPU count and jobs smaller than ``PARALLEL_MIN_PAGES`` pages are
+    rendered serially.
+
+    ``collector`` is an optional callable that receives one event dict per
+    page (template, section, page, start, seconds, build_seconds, emitted
+    bytes and, when ``tracemalloc`` is tracing, allocated bytes); seconds
+    covers building the page's slot values as well as rendering it, and
+    build_seconds is the building part alone. Instrumented builds always
+    render serially so every page is timed. ``pages`` optionally limits the
+    build to a set of page numbers. ``minify`` selects one of
+    ``MINIFY_MODES`` instead of the pretty-printed templates.
+    ``head_extra`` is markup (inline styles, fonts) inserted just before
+    ``</head>``; ``inline_css`` replaces the journal.css ``<link>`` with an
+    inline ``<style>``. ``journal`` is a prebuilt ``page_model.Journal``
+    to render instead of calling ``iter_page_specs``; otherwise the
+    remaining keyword options are passed to ``iter_page_specs``.
+    """
+    if head_extra or inline_css is not None:
+        chunks = iter_pages(workers, collector, pages, minify, journal=journal, **options)
+        head = next(chunks)
+        if inline_css is not None:
+            head = head.replace(STYLESHEET_LINK, f"<style>{inline_css}</style>", 1)
+        if head_extra:
+            head = head.replace("</head>", head_extra + "</head>", 1)
+        yield head
+        yield from chunks
+        return
+    specs = journal.specs() if journal is not None else iter_page_specs(**options)
+    if pages is not None:
+        specs = select_pages(specs, pages)
+    if collector is not None:
+        yield from _iter_pages_instrumented(specs, collector, registry_for(minify))
+        return
+    workers = min(workers or 1, os.cpu_count() or 1)
+    if workers > 1:
+        specs = list(specs)
+        if len(specs) >= PARALLEL_MIN_PAGES:
+            yield from _iter_pages_parallel(specs, workers, minify)
+            return
+    get = registry_for(minify).get
+    for name, values in specs:
+        yield get(name).render(**values)
+
+def generate_html(**options):
+    """Return the complete journal as a single string; options go to ``iter_pages``."""
+    return "".join(iter_pages(**options))
+
+def write_html(target, **options):
+    """Stream the journal into a file or socket one page at a time.
+
+    Text streams receive ``str`` chunks; binary files and sockets receive
+    UTF-8 bytes. Only the page currently being rendered is held in memory.
+    Returns the number of UTF-8 bytes written.
+    """
+    written = 0
+    if isinstance(target, io.TextIOBase):
+        for chunk in iter_pages(**options):
+            target.write(chunk)
+            written += len(chunk.encode("utf-8"))
+        return written
+
+    send = getattr(target, "sendall", None) or target.write
+    for chunk in iter_pages(**options):
+        data = chunk.encode("utf-8")
+        send(data)
+        written += len(data)
+    return written
+
+def write_atomic(path, buffered=False, precompress=None, **options):
+    """Write the journal to ``path`` via a temp file and rename.
+
+    A static-file server reading ``path`` during a rebuild sees either the
+    old file or the new one, never a half-written journal. ``buffered``
+    renders the whole document before writing instead of streaming it.
+    ``precompress`` maps encodings (``"gzip"``, ``"br"``) to compression
+    levels; each is written to ``path`` plus ``.gz``/``.br`` from the same
+    pass and renamed into place before ``path`` itself. Compressed copies
+    left by an earlier build for encodings not requested are deleted, and
+    so is the page index of an earlier ``--incremental`` build.
+    Returns the number of bytes written to ``path``.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    targets = [(path, None)] + [(path + SUFFIXES[encoding], encoding) for encoding in precompress or ()]
+    temps, files = [], {}
+    try:
+        for target, encoding in targets:
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".index-", suffix=".tmp")
+            temps.append((tmp, target))
+            files[encoding] = os.fdopen(fd, "wb")
+        sink = PrecompressingWriter(files[None], {encoding: (f, precompress[encoding])
+                                                  for encoding, f in files.items() if encoding})
+        if buffered:
+            data = generate_html(**options).encode("utf-8")
+            sink.write(data)
+            written = len(data)
+        else:
+            written = write_html(sink, **options)
+        sink.close()
+        for f in files.values():
+            f.close()
+        # Compressed copies go first so they are never older than the HTML beside them
+        for tmp, target in reversed(temps):
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, target)
+    except BaseException:
+        for f in files.values():
+            f.close()
+        for tmp, _target in temps:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        raise
+    remove_stale(path, keep=precompress or ())
+    # A page index left by --incremental describes the old file, not this one
+    from incremental import remove_index
+    remove_index(path)
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the A5 Leverage Journal HTML.")
+    parser.add_argument("-o", "--output", default=os.path.join("dist", "index.html"),
+                        help="output file, or - for stdout (default: dist/index.html)")
+    parser.add_argument("--variant", choices=sorted(VARIANTS), default="standard", help="build variant")
+    parser.add_argument("--start-date", metavar="YYYY-MM-DD",
+                        help="print real dates on the day pages and weekly reviews, starting on this day")
+    parser.add_argument("--locale", choices=sorted(LOCALES), default=DEFAULT_LOCALE,
+                        help="date format and weekday names for --start-date (default: en-US)")
+    parser.add_argument("--quotes", metavar="CORPUS",
+                        help="draw day quotes from this JSON-lines corpus (indexed on first use)")
+    parser.add_argument("--wisdom", metavar="CORPUS", help="draw footer wisdom from this JSON-lines corpus")
+    parser.add_argument("--quote-seed", help="rotate quotes and wisdom in a fixed order derived from this seed")
+    parser.add_argument("--pages", help="only render these pages, e.g. 1-30,205")
+    parser.add_argument("--mode", choices=("stream", "buffered"), default="stream",
+                        help="stream pages as they render, or render everything before writing")
+    parser.add_argument("--minify", nargs="?", const="keep-markers", choices=MINIFY_MODES,
+                        help="collapse whitespace and hoist repeated inline styles into classes; "
+                             "drop-markers also removes HTML comments (default: keep-markers)")
+    parser.add_argument("--workers", type=int, default=1, help="render pages on this many processes (only "
+                        f"jobs of {PARALLEL_MIN_PAGES}+ pages on multi-core machines)")
+    parser.add_argument("--entries", help="JSON file of journal_entries rows (or entriesByDay) to personalize")
+    parser.add_argument("--incremental", action="store_true",
+                        help="splice only changed pages into the existing output")
+    parser.add_argument("--shards", action="store_true",
+                        help="write the cover and commitment to OUTPUT and lazy-load the other sections from shards/")
+    parser.add_argument("--embed-fonts", nargs="?", const="", metavar="FONTS_DIR",
+                        help="inline the journal fonts subset to the glyphs used (needs fontTools; "
+                             "default dir: fonts/)")
+    parser.add_argument("--critical-css", action="store_true",
+                        help="inline only the journal.css rules the pages can match instead of linking it")
+    parser.add_argument("--pdf", help="also print the journal to this A5 PDF with a headless renderer")
+    parser.add_argument("--epub", metavar="PATH", help="also write a fixed-layout EPUB 3 of the journal")
+    parser.add_argument("--json", metavar="PATH", help="also write the page model (content without markup) as JSON")
+    parser.add_argument("--gzip", type=int, nargs="?", const=DEFAULT_LEVELS["gzip"], metavar="LEVEL",
+                        help="also write OUTPUT.gz in the same pass (level 1-9, default 9)")
+    parser.add_argument("--brotli", type=int, nargs="?", const=DEFAULT_LEVELS["br"], metavar="QUALITY",
+                        help="also write OUTPUT.br in the same pass (quality 0-11, default 11; needs brotli)")
+    parser.add_argument("--profile", help="write per-section/per-template timings as JSON to this file")
+    parser.add_argument("--trace", help="write a Chrome trace of the build to this file")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="also record allocated bytes per page (slower)")
+    args = parser.parse_args(argv)
+    
+    to_stdout = args.output == "-"
+    if args.incremental and (to_stdout or args.pages):
+        parser.error("--incremental needs a file output and the full page range")
+    if args.minify and (args.incremental or args.shards):
+        parser.error("--minify cannot be combined with --incremental or --shards")
+    if (args.embed_fonts is not None or args.critical_css) and (args.incremental or args.shards):
+        parser.error("--embed-fonts and --critical-css cannot be combined with --incremental or --shards")
+    precompress = {}
+    if args.gzip is not None:
+        if not 1 <= args.gzip <= 9:
+            parser.error("--gzip level must be between 1 and 9")
+        precompress["gzip"] = args.gzip
+    if args.brotli is not None:
+        if not 0 <= args.brotli <= 11:
+            parser.error("--brotli quality must be between 0 and 11")
+        if brotli is None:
+            parser.error("--brotli needs the optional 'brotli' package (pip install brotli)")
+        precompress["br"] = args.brotli
+    if precompress and (to_stdout or args.incremental):
+        parser.error("--gzip/--brotli need a full file output")
+    if args.shards and (to_stdout or args.incremental or args.pages or precompress or args.profile or args.trace):
+        parser.error("--shards writes a full build to a file and cannot be combined with "
+                     "--incremental, --pages, --gzip/--brotli or profiling")
+    try:
+        pages = parse_page_range(args.pages) if args.pages else None
+        start_date = parse_start_date(args.start_date) if args.start_date else None
+    except ValueError as exc:
+        parser.error(str(exc))
+    # Keep stdout clean for the HTML when streaming to it
+    log = sys.stderr if to_stdout else sys.stdout
+    
+    options = dict(VARIANTS[args.variant])
+    if start_date:
+        options.update(start_date=start_date, locale=args.locale)
+    if args.quote_seed is not None:
+        options["quote_seed"] = args.quote_seed
+    for name in ("quotes", "wisdom"):
+        path = getattr(args, name)
+        if path:
+            try:
+                options[name] = QuoteCorpus(path)
+            except (OSError, ValueError) as exc:
+                parser.error(f"--{name}: {exc}")
+    if args.entries:
+        try:
+            with open(args.entries, encoding='utf-8') as f:
+                options["entries"] = json.load(f)
+        except (OSError, ValueError) as exc:
+            parser.error(f"--entries: {exc}")
+    
+    exporter = None
+    if args.pdf:
+        from pdf import PdfExporter
+        try:
+            exporter = PdfExporter(workers=args.workers if args.workers > 1 else None)
+        except RuntimeError as exc:
+            parser.error(str(exc))
+    
+    # Several outputs read the same pages: build the page model once for all of them
+    journal = None
+    if args.json or args.pdf or args.epub or args.embed_fonts is not None or args.critical_css:
+        from page_model import build_journal
+        journal = build_journal(**options)
+    
+    def page_specs():
+        return journal.specs() if journal is not None else iter_page_specs(**options)
+    
+    head_extra = None
+    if args.embed_fonts is not None:
+        from fonts import DEFAULT_FONTS_DIR, FontSubsetter, used_codepoints
+        try:
+            subsetter = FontSubsetter(args.embed_fonts or DEFAULT_FONTS_DIR)
+        except RuntimeError as exc:
+            parser.error(str(exc))
+        specs = page_specs()
+        if pages is not None:
+            specs = select_pages(specs, pages)
+        head_extra = subsetter.font_css(used_codepoints(specs, registry_for(args.minify)))
+        print(f"✅ {subsetter.report()}", file=log)
+    
+    inline_css = None
+    if args.critical_css:
+        from critical_css import DEFAULT_STYLESHEET, critical_css, deferred_stylesheets, imported_stylesheets
+        inline_css = critical_css(registry_for(args.minify), page_specs())
+        # The web-font @import is not inlined; embedded fonts replace it outright
+        if args.embed_fonts is None:
+            head_extra = (head_extra or "") + deferred_stylesheets(imported_stylesheets())
+        print(f"✅ Critical CSS: {len(inline_css.encode('utf-8')) / 1024:.1f} KB inlined "
+              f"(journal.css is {os.path.getsize(DEFAULT_STYLESHEET) / 1024:.1f} KB)", file=log)
+    
+    profile = None
+    if args.profile or args.trace:
+        from instrument import BuildProfile
+        profile = BuildProfile()
+        if args.profile_memory:
+            tracemalloc.start()
+    
+    if args.incremental:
+        from incremental import rebuild
+        changed = rebuild(args.output, **options)
+        size = os.path.getsize(args.output)
+        listed = ", ".join(changed) if len(changed) <= 20 else "all"
+        print(f"✅ Re-rendered {len(changed)} page block(s): {listed or 'none'}", file=log)
+    elif args.shards:
+        from shards import write_sharded
+        manifest = write_sharded(args.output, workers=args.workers, **options)
+        size = os.path.getsize(args.output)
+        shard_bytes = sum(shard["bytes"] for shard in manifest["shards"])
+        print(f"✅ Wrote {len(manifest['shards'])} shards ({shard_bytes / 1024:.1f} KB) "
+              f"→ {os.path.join(os.path.dirname(args.output), 'shards')}", file=log)
+    elif to_stdout:
+        out = sys.stdout.buffer
+        if args.mode == "buffered":
+            data = generate_html(workers=args.workers, collector=profile, pages=pages,
+                                 minify=args.minify, head_extra=head_extra,
+                                 inline_css=inline_css, journal=journal, **options)
+            size = out.write(data.encode("utf-8"))
+        else:
+            size = write_html(out, workers=args.workers, collector=profile, pages=pages,
+                              minify=args.minify, head_extra=head_extra,
+                              inline_css=inline_css, journal=journal, **options)
+        out.flush()
+    else:
+        size = write_atomic(args.output, buffered=args.mode == "buffered", precompress=precompress,
+                            workers=args.workers, collector=profile, pages=pages,
+                            minify=args.minify, head_extra=head_extra,
+                            inline_css=inline_css, journal=journal, **options)
+    
+    if pages:
+        # Count what was emitted: a range may run past the last page
+        page_count = sum(1 for _name, values in select_pages(page_specs(), pages) if "page" in values)
+    else:
+        page_count = journal.page_count() if journal is not None else count_pages(**options)
+    print(f"✅ Generated A5 journal HTML with {page_count} pages ({args.variant})", file=log)
+    print(f"✅ File size: {size / 1024:.1f} KB" + ("" if to_stdout else f" → {args.output}"), file=log)
+    if precompress:
+        sizes = {args.output: size}
+        for encoding in precompress:
+            sizes[args.output + SUFFIXES[encoding]] = os.path.getsize(args.output + SUFFIXES[encoding])
+        for line in compression_report(sizes, args.output):
+            print(f"✅ {line}", file=log)
+    if profile:
+        print(profile.report(), file=log)
+        if args.profile:
+            profile.write_json(args.profile)
+        if args.trace:
+            profile.write_chrome_trace(args.trace)
+    if args.json:
+        from page_model import write_json
+        json_size = write_json(journal, args.json)
+        print(f"✅ Page model: {json_size / 1024:.1f} KB → {args.json}", file=log)
+    if args.epub:
+        from epub import write_epub
+        epub_size = write_epub(args.epub, journal)
+        print(f"✅ EPUB: {epub_size / 1024:.1f} KB → {args.epub}", file=log)
+    if exporter:
+        exporter.export(args.pdf, journal=journal)
+        exporter.trim()
+        print(f"✅ {exporter.report()} → {args.pdf}", file=log)
+    else:
+        print(f"✅ Ready for PDF export", file=log)
+    return 0
 
 if __name__ == "__main__":
-    html_content = generate_html()
-    
-    with open('/home/claude/leverage-journal-A5/index.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"✅ Generated complete A5 journal HTML with 222 pages")
-    print(f"✅ File size: {len(html_content) / 1024:.1f} KB")
-    print(f"✅ Ready for PDF export")
+    try:
+        sys.exit(main())
+    except CorpusError as exc:
+        # Records are read as pages are built, so a bad one only turns up mid-build
+        sys.exit(f"❌ {exc}")
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Incremental Rebuild
+Re-renders only the pages whose inputs changed and splices them into an existing index.html
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from generate import iter_page_specs
+from precompress import remove_stale
+from templates import REGISTRY
+
+INDEX_SUFFIX = ".pages.json"
+INDEX_VERSION = 2
+
+_MARKER = re.compile(rb"<!-- PAGE (\d{3,}): ")
+_TAIL = b"</body>"
+_COPY_CHUNK = 1024 * 1024
+
+def index_path(path):
+    return path + INDEX_SUFFIX
+
+def remove_index(path):
+    """Delete the page index of ``path``; called whenever something else rewrites it."""
+    try:
+        os.unlink(index_path(path))
+    except FileNotFoundError:
+        pass
+
+def page_key(template, values):
+    """Hash a template's source digest together with its slot values."""
+    payload = json.dumps(values, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{template.digest}\0{payload}".encode("utf-8")).hexdigest()
+
+def _label(name, values):
+    return values.get("page", name)
+
+def scan_blocks(data):
+    """Split generator output on its PAGE markers.
+
+    Returns ``(label, start, end)`` byte ranges in document order: the
+    ``document_head``, one range per page labelled by its three-digit
+    page number, then the ``document_tail``.
+    """
+    starts = [(m.group(1).decode("ascii"), m.start()) for m in _MARKER.finditer(data)]
+    tail = data.rfind(_TAIL)
+    if tail < 0:
+        tail = len(data)
+    if not starts:
+        return [("document_head", 0, tail), ("document_tail", tail, len(data))]
+    blocks = [("document_head", 0, starts[0][1])]
+    for (label, start), nxt in zip(starts, starts[1:] + [(None, tail)]):
+        blocks.append((label, start, nxt[1]))
+    blocks.append(("document_tail", tail, len(data)))
+    return blocks
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_COPY_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_index(path):
+    """Return the page-offset index for ``path``, or ``None`` if it is missing or stale.
+
+    The index records the size and SHA-256 of the output it describes; a
+    file rewritten by anything else (a full build with other options can
+    have the very same size) no longer matches and is rescanned.
+    """
+    try:
+        with open(index_path(path), encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+    try:
+        if os.path.getsize(path) != index["size"] or _file_digest(path) != index["sha256"]:
+            return None
+    except (OSError, KeyError):
+        return None
+    return index
+
+def _write_index(path, blocks, sha256):
+    index = {
+        "version": INDEX_VERSION,
+        "size": blocks[-1]["end"] if blocks else 0,
+        "sha256": sha256,
+        "blocks": blocks,
+    }
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, index_path(path))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return index
+
+def read_page(path, label, index=None):
+    """Seek straight to one page block using the offset index."""
+    index = index or load_index(path)
+    if index is None:
+        raise FileNotFoundError(f"no page index for {path}")
+    for block in index["blocks"]:
+        if block["label"] == label:
+            with open(path, "rb") as f:
+                f.seek(block["start"])
+                return f.read(block["end"] - block["start"]).decode("utf-8")
+    raise KeyError(label)
+
+def _render_specs(options):
+    """Yield ``(label, key, template, values)`` for every block of the current build."""
+    get = REGISTRY.get
+    for name, values in iter_page_specs(**options):
+        template = get(name)
+        yield _label(name, values), page_key(template, values), template, values
+
+def _render(template, values):
+    return template.render(**values).encode("utf-8")
+
+def write_full(path, **options):
+    """Write the whole journal to ``path`` atomically and record its page index."""
+    blocks = []
+    offset = 0
+    digest = hashlib.sha256()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for label, key, template, values in _render_specs(options):
+                data = _render(template, values)
+                f.write(data)
+                digest.update(data)
+                blocks.append({"label": label, "start": offset, "end": offset + len(data), "key": key})
+                offset += len(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    remove_stale(path)
+    return _write_index(path, blocks, digest.hexdigest())
+
+def _index_from_scan(path):
+    """Rebuild an index for output that has no index yet; keys are unknown."""
+    with open(path, "rb") as f:
+        data = f.read()
+    blocks = [{"label": label, "start": start, "end": end, "key": None}
+              for label, start, end in scan_blocks(data)]
+    return {"version": INDEX_VERSION, "size": len(data), "sha256": hashlib.sha256(data).hexdigest(),
+            "blocks": blocks}
+
+def _copy_range(src, dst, start, end, digest):
+    src.seek(start)
+    remaining = end - start
+    while remaining:
+        chunk = src.read(min(_COPY_CHUNK, remaining))
+        if not chunk:
+            raise IOError("page index points past the end of the file")
+        dst.write(chunk)
+        digest.update(chunk)
+        remaining -= len(chunk)
+
+def rebuild(path, **options):
+    """Bring ``path`` up to date with the current generator data.
+
+    Pages whose template and inputs hash to the same key as the stored
+    index are left untouched. Changed pages are re-rendered and spliced
+    into a temp file by copying unchanged byte ranges around the new
+    blocks, which is then renamed over ``path``, so readers never see a
+    half-patched journal. A change in page structure (pages added or
+    removed) falls back to a full build. Any ``.gz``/``.br`` copies of
+    ``path`` are deleted once it changes, since they would be stale.
+    Returns the list of labels that were re-rendered.
+    """
+    if not os.path.exists(path):
+        index = write_full(path, **options)
+        return [block["label"] for block in index["blocks"]]
+
+    index = load_index(path) or _index_from_scan(path)
+    old_blocks = index["blocks"]
+    specs = list(_render_specs(options))
+    if [block["label"] for block in old_blocks] != [spec[0] for spec in specs]:
+        index = write_full(path, **options)
+        return [block["label"] for block in index["blocks"]]
+
+    changed = {}
+    with open(path, "rb") as f:
+        for i, ((label, key, template, values), block) in enumerate(zip(specs, old_blocks)):
+            if block["key"] == key:
+                continue
+            data = _render(template, values)
+            if block["key"] is None:
+                # Index came from a scan; compare bytes to find real changes.
+                f.seek(block["start"])
+                if f.read(block["end"] - block["start"]) == data:
+                    block["key"] = key
+                    continue
+            changed[i] = (key, data)
+
+    if not changed:
+        _write_index(path, old_blocks, index["sha256"])
+        return []
+
+    new_blocks = []
+    offset = 0
+    digest = hashlib.sha256()
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            for i, block in enumerate(old_blocks):
+                if i in changed:
+                    key, data = changed[i]
+                    dst.write(data)
+                    digest.update(data)
+                    length = len(data)
+                else:
+                    key = block["key"]
+                    length = block["end"] - block["start"]
+                    _copy_range(src, dst, block["start"], block["end"], digest)
+                new_blocks.append({"label": block["label"], "start": offset, "end": offset + length, "key": key})
+                offset += length
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    remove_stale(path)
+    _write_index(path, new_blocks, digest.hexdigest())
+    return [old_blocks[i]["label"] for i in changed]
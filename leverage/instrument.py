@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Build Instrumentation
+Collects per-page render events and summarises them by section and page type
+"""
+
+import json
+
+def _totals():
+    return {"pages": 0, "seconds": 0.0, "build_seconds": 0.0, "bytes": 0, "allocated": 0}
+
+def _add(totals, event):
+    totals["pages"] += 1
+    totals["seconds"] += event["seconds"]
+    totals["build_seconds"] += event.get("build_seconds", 0.0)
+    totals["bytes"] += event["bytes"]
+    totals["allocated"] += event["allocated"] or 0
+
+class BuildProfile:
+    """Collector for ``iter_pages(collector=...)``.
+
+    Keeps every page event so the build can be exported either as a JSON
+    summary or as a Chrome trace (``chrome://tracing`` / Perfetto).
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def summary(self):
+        """Totals per section, per page template and for the whole build."""
+        sections, templates, total = {}, {}, _totals()
+        for event in self.events:
+            _add(sections.setdefault(event["section"], _totals()), event)
+            _add(templates.setdefault(event["template"], _totals()), event)
+            _add(total, event)
+        return {"total": total, "sections": sections, "templates": templates}
+
+    def chrome_trace(self):
+        """Trace Event Format: one slice per section with the pages nested inside."""
+        if not self.events:
+            return {"traceEvents": []}
+        origin = self.events[0]["start"]
+        trace = []
+        section_start = {}
+        section_end = {}
+        for event in self.events:
+            start = (event["start"] - origin) * 1e6
+            end = start + event["seconds"] * 1e6
+            section_start.setdefault(event["section"], start)
+            section_end[event["section"]] = end
+            trace.append({
+                "name": event["page"] or event["template"],
+                "cat": event["template"],
+                "ph": "X",
+                "ts": start,
+                "dur": event["seconds"] * 1e6,
+                "pid": 1,
+                "tid": 1,
+                "args": {"template": event["template"], "bytes": event["bytes"],
+                         "build_ms": event.get("build_seconds", 0.0) * 1000,
+                         "allocated": event["allocated"]},
+            })
+        for section, start in section_start.items():
+            trace.append({
+                "name": section,
+                "cat": "section",
+                "ph": "X",
+                "ts": start,
+                "dur": section_end[section] - start,
+                "pid": 1,
+                "tid": 1,
+            })
+        trace.sort(key=lambda slice_: (slice_["ts"], -slice_["dur"]))
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+            f.write("\n")
+
+    def write_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def report(self):
+        lines = [f"{'section':<12} {'pages':>5} {'ms':>9} {'build ms':>9} {'KB out':>9} {'KB alloc':>9}"]
+        for section, totals in self.summary()["sections"].items():
+            lines.append(f"{section:<12} {totals['pages']:>5} {totals['seconds'] * 1000:>9.2f} "
+                         f"{totals['build_seconds'] * 1000:>9.2f} "
+                         f"{totals['bytes'] / 1024:>9.1f} {totals['allocated'] / 1024:>9.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Minified Output
+Compiles a whitespace-collapsed copy of the templates with repeated inline styles hoisted into classes
+"""
+
+import re
+from collections import Counter
+
+from templates import _SLOT, TemplateRegistry
+
+CLASS_PREFIX = "ljs"
+
+# Contents of these elements are copied untouched
+_PRESERVE = re.compile(r"(<(script|style|pre|textarea)\b.*?</\2>)", re.S | re.I)
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_SPACE = re.compile(r"\s+")
+_TAG = re.compile(r"<[a-zA-Z][^<>]*>")
+_STYLE_ATTR = re.compile(r'\sstyle="([^"]*)"')
+_CLASS_ATTR = re.compile(r'\sclass="([^"]*)"')
+
+def _outside_preserved(source, transform):
+    parts = _PRESERVE.split(source)
+    # split() yields text, whole preserved element, element name, text, ...
+    for i in range(0, len(parts), 3):
+        parts[i] = transform(parts[i])
+    return "".join(part for i, part in enumerate(parts) if i % 3 != 2)
+
+def collapse_whitespace(source):
+    """Collapse every run of whitespace outside script/style/pre/textarea to one space."""
+    return _outside_preserved(source, lambda text: _SPACE.sub(" ", text))
+
+def drop_comments(source):
+    return _outside_preserved(source, lambda text: _COMMENT.sub("", text))
+
+def _normalize_style(style):
+    return "; ".join(decl.strip() for decl in style.split(";") if decl.strip())
+
+def _styles(source):
+    for tag in _TAG.findall(source):
+        match = _STYLE_ATTR.search(tag)
+        if match and not _SLOT.search(match.group(1)):
+            yield _normalize_style(match.group(1))
+
+def hoist_styles(sources, usage):
+    """Pick the inline styles worth turning into classes.
+
+    ``sources`` maps template names to source text and ``usage`` counts
+    how often each template is rendered per document. A style rendered
+    more than once gets a class; the most used styles get the shortest
+    names. Styles containing slots stay inline.
+    """
+    counts = Counter()
+    for name, source in sources.items():
+        for style in _styles(source):
+            counts[style] += usage.get(name, 0)
+    hoisted = [style for style, count in counts.most_common() if count > 1 and style]
+    return {style: f"{CLASS_PREFIX}{i}" for i, style in enumerate(hoisted)}
+
+def stylesheet(classes):
+    """CSS for hoisted styles; ``!important`` keeps the precedence inline styles had."""
+    rules = []
+    for style, name in classes.items():
+        decls = []
+        for decl in style.split("; "):
+            prop, _, value = decl.partition(":")
+            value = value.strip()
+            if not value.endswith("!important"):
+                value += "!important"
+            decls.append(f"{prop.strip()}:{value}")
+        rules.append(f".{name}{{{';'.join(decls)}}}")
+    return "<style>" + "".join(rules) + "</style>"
+
+def _rewrite_tag(tag, classes):
+    match = _STYLE_ATTR.search(tag)
+    if not match:
+        return tag
+    name = classes.get(_normalize_style(match.group(1)))
+    if name is None:
+        return tag
+    tag = tag[:match.start()] + tag[match.end():]
+    existing = _CLASS_ATTR.search(tag)
+    if existing:
+        return f'{tag[:existing.end(1)]} {name}{tag[existing.end(1):]}'
+    end = -2 if tag.endswith("/>") else -1
+    return f'{tag[:end]} class="{name}"{tag[end:]}'
+
+def apply_classes(source, classes):
+    return _outside_preserved(source, lambda text: _TAG.sub(lambda m: _rewrite_tag(m.group(0), classes), text))
+
+def minify_registry(registry, usage, drop_markers=False):
+    """Return a new registry holding a minified copy of every template in ``registry``.
+
+    ``usage`` maps template names to render counts (see ``hoist_styles``).
+    With ``drop_markers`` HTML comments, including the ``PAGE NNN``
+    markers, are removed as well. The hoisted stylesheet goes just before
+    ``</head>``.
+    """
+    sources = {name: registry.get(name).source for name in registry}
+    classes = hoist_styles(sources, usage)
+    minified = TemplateRegistry()
+    for name, source in sources.items():
+        if drop_markers:
+            source = drop_comments(source)
+        source = collapse_whitespace(apply_classes(source, classes))
+        if "</head>" in source and classes:
+            source = source.replace("</head>", stylesheet(classes) + "</head>", 1)
+        minified.register(name, source)
+    return minified
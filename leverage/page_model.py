@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Page Model
+A compact tree of sections, pages and fields built once and serialized to HTML, JSON and more
+"""
+
+import json
+import os
+import tempfile
+
+from generate import TEMPLATE_SECTIONS, iter_page_specs
+from templates import REGISTRY
+
+class Field:
+    """One named piece of page content (a slot value)."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+class Page:
+    """One page: the template that lays it out, its number and its fields.
+
+    The document head and tail are pages without a number.
+    """
+
+    __slots__ = ("template", "number", "fields")
+
+    def __init__(self, template, number, fields):
+        self.template = template
+        self.number = number
+        self.fields = fields
+
+    def values(self):
+        """Slot values for the page's template, page number included."""
+        values = {field.name: field.value for field in self.fields}
+        if self.number is not None:
+            values["page"] = f"{self.number:03d}"
+        return values
+
+class Section:
+    """A run of consecutive pages that belong to one ``SECTIONS`` entry."""
+
+    __slots__ = ("name", "pages")
+
+    def __init__(self, name, pages):
+        self.name = name
+        self.pages = pages
+
+class Journal:
+    """The whole journal as sections of pages, independent of any output format."""
+
+    __slots__ = ("sections",)
+
+    def __init__(self, sections):
+        self.sections = sections
+
+    def pages(self):
+        for section in self.sections:
+            yield from section.pages
+
+    def specs(self):
+        """``(template_name, slot_values)`` pairs, as ``iter_page_specs`` yields them."""
+        for page in self.pages():
+            yield page.template, page.values()
+
+    def page_count(self):
+        return sum(1 for page in self.pages() if page.number is not None)
+
+def build_journal(**options):
+    """Build the page model once; options go to ``iter_page_specs``."""
+    sections = []
+    for name, values in iter_page_specs(**options):
+        number = values.get("page")
+        page = Page(name, int(number) if number is not None else None,
+                    tuple(Field(key, value) for key, value in values.items() if key != "page"))
+        section = TEMPLATE_SECTIONS.get(name, name)
+        if not sections or sections[-1].name != section:
+            sections.append(Section(section, []))
+        sections[-1].pages.append(page)
+    for section in sections:
+        section.pages = tuple(section.pages)
+    return Journal(tuple(sections))
+
+def iter_html(journal, registry=REGISTRY):
+    """HTML backend: yield the markup of every page in document order."""
+    get = registry.get
+    for page in journal.pages():
+        yield get(page.template).render(**page.values())
+
+def iter_json(journal):
+    """JSON backend: yield the model as JSON text, one page at a time.
+
+    The document head and tail carry no content and are left out; fields
+    keep their values verbatim (some hold markup).
+    """
+    yield '{"sections":['
+    first_section = True
+    for section in journal.sections:
+        pages = [page for page in section.pages if page.number is not None]
+        if not pages:
+            continue
+        yield ("" if first_section else ",") + '{"name":' + json.dumps(section.name) + ',"pages":['
+        for i, page in enumerate(pages):
+            yield ("," if i else "") + json.dumps({
+                "page": page.number,
+                "template": page.template,
+                "fields": {field.name: field.value for field in page.fields},
+            }, ensure_ascii=False)
+        yield "]}"
+        first_section = False
+    yield "]}\n"
+
+def write_json(journal, path):
+    """Write the JSON backend's output to ``path`` atomically; returns bytes written."""
+    written = 0
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in iter_json(journal):
+                data = chunk.encode("utf-8")
+                f.write(data)
+                written += len(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return written
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Page Diff
+Compares two generator outputs page by page and shows a focused diff for each changed page
+"""
+
+import argparse
+import difflib
+import hashlib
+import re
+import sys
+
+from generate import parse_page_range
+from incremental import scan_blocks
+
+# Minified output runs many tags together on one line; split those between tags
+_BETWEEN_TAGS = re.compile(r"(?<=>)\s*(?=<)")
+_LONG_LINE = 160
+
+def read_output(path):
+    """Generator output as bytes; ``-`` reads standard input."""
+    if path == "-":
+        return sys.stdin.buffer.read()
+    with open(path, "rb") as f:
+        return f.read()
+
+def page_hashes(data):
+    """Map each block label of ``data`` to ``(digest, start, end)``, in document order."""
+    view = memoryview(data)
+    return {label: (hashlib.blake2b(view[start:end], digest_size=16).digest(), start, end)
+            for label, start, end in scan_blocks(data)}
+
+def compare(old, new):
+    """Return ``(added, removed, changed)`` block labels plus both hash maps.
+
+    Each output is scanned and hashed once, so the comparison is linear in
+    their combined size; only the changed pages are ever decoded.
+    """
+    old_pages, new_pages = page_hashes(old), page_hashes(new)
+    added = [label for label in new_pages if label not in old_pages]
+    removed = [label for label in old_pages if label not in new_pages]
+    changed = [label for label, (digest, _start, _end) in new_pages.items()
+               if label in old_pages and old_pages[label][0] != digest]
+    return added, removed, changed, old_pages, new_pages
+
+def _lines(markup):
+    lines = []
+    for line in markup.splitlines():
+        lines.extend(_BETWEEN_TAGS.split(line) if len(line) > _LONG_LINE else (line,))
+    return [line + "\n" for line in lines]
+
+def page_diff(old, new, old_block, new_block, label, context=3):
+    """Unified diff of one block, split into lines (or tags, for minified output)."""
+    before = _lines(old[old_block[1]:old_block[2]].decode("utf-8")) if old_block else []
+    after = _lines(new[new_block[1]:new_block[2]].decode("utf-8")) if new_block else []
+    name = f"page {label}" if label.isdigit() else label
+    return difflib.unified_diff(before, after, f"a/{name}", f"b/{name}", n=context)
+
+def unexpected(labels, allowed):
+    """Labels outside the ``allowed`` page set; head/tail changes are never allowed."""
+    return [label for label in labels if not label.isdigit() or int(label) not in allowed]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two journal builds page by page.")
+    parser.add_argument("old", help="previous generator output")
+    parser.add_argument("new", help="new generator output, or - for stdin")
+    parser.add_argument("--expect", metavar="PAGES",
+                        help="fail only if pages outside this range changed, e.g. 206-218")
+    parser.add_argument("--stat", action="store_true", help="list changed pages without diffs")
+    parser.add_argument("-U", "--context", type=int, default=3, help="lines of diff context (default 3)")
+    args = parser.parse_args(argv)
+    try:
+        allowed = parse_page_range(args.expect) if args.expect else None
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    old, new = read_output(args.old), read_output(args.new)
+    added, removed, changed, old_pages, new_pages = compare(old, new)
+    for mark, labels in (("+", added), ("-", removed), ("~", changed)):
+        for label in labels:
+            print(f"{mark} {'page ' + label if label.isdigit() else label}")
+            if not args.stat:
+                diff = page_diff(old, new, old_pages.get(label), new_pages.get(label), label, args.context)
+                sys.stdout.writelines(diff)
+
+    identical = len(new_pages) - len(added) - len(changed)
+    print(f"{len(changed)} changed, {len(added)} added, {len(removed)} removed, {identical} identical",
+          file=sys.stderr)
+    differing = added + removed + changed
+    if allowed is None:
+        return 1 if differing else 0
+    outside = unexpected(differing, allowed)
+    if outside:
+        print(f"❌ Unexpected changes outside {args.expect}: {', '.join(outside)}", file=sys.stderr)
+        return 1
+    print(f"✅ Only pages in {args.expect} changed", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - PDF Export
+Prints the journal to an A5 PDF with a local headless renderer, one cached page range per worker
+"""
+
+import argparse
+import hashlib
+import os
+import pathlib
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pypdf
+except ImportError:  # optional: pip install pypdf
+    pypdf = None
+
+try:
+    import weasyprint
+except ImportError:  # optional: pip install weasyprint
+    weasyprint = None
+
+from batch import output_path, read_records, user_options
+from critical_css import DEFAULT_STYLESHEET
+from fonts import DEFAULT_FONTS_DIR, FONT_FACES, find_font
+from generate import iter_page_specs
+from shards import group_specs
+from templates import REGISTRY
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(HERE, "build", "pdf-cache")
+CHROME_NAMES = ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable", "chrome")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+RENDER_TIMEOUT = 300
+
+def find_renderer(name=None):
+    """Return ``(kind, executable)`` for the renderer to use: ``chrome`` or ``weasyprint``.
+
+    ``name`` forces one kind; otherwise a Chrome/Chromium on PATH is
+    preferred and the weasyprint package is the fallback.
+    """
+    if name in (None, "chrome"):
+        for candidate in CHROME_NAMES:
+            path = shutil.which(candidate)
+            if path:
+                return "chrome", path
+    if name in (None, "weasyprint") and weasyprint is not None:
+        return "weasyprint", None
+    wanted = name or "Chrome/Chromium or weasyprint"
+    raise RuntimeError(f"no PDF renderer found: install {wanted}")
+
+def page_ranges(base_href, journal=None, **options):
+    """Yield ``(label, html)`` per page range: the cover and commitment, then one per shard.
+
+    Ranges follow the shards of ``--shards`` (sections, one per week of
+    daily spreads), so a change to one week only changes that range.
+    Every range is a complete document that resolves ``css/`` against
+    ``base_href``. A prebuilt ``page_model.Journal`` is used instead of
+    ``iter_page_specs(**options)`` when given.
+    """
+    specs = journal.specs() if journal is not None else iter_page_specs(**options)
+    index_specs, shards = group_specs(specs)
+    head, *front, tail = index_specs
+
+    def render(specs):
+        return "".join(REGISTRY.render(name, **values) for name, values in specs)
+
+    head_markup = render([head]).replace("<head>", f'<head>\n    <base href="{base_href}">', 1)
+    tail_markup = render([tail])
+    yield "front", head_markup + render(front) + tail_markup
+    for shard, specs in shards:
+        yield shard, head_markup + render(specs) + tail_markup
+
+def print_range(renderer, html, pdf_path):
+    """Process-pool worker: print one range document to ``pdf_path``."""
+    kind, executable = renderer
+    directory = os.path.dirname(pdf_path)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".range-", suffix=".pdf")
+    os.close(fd)
+    source = None
+    try:
+        if kind == "weasyprint":
+            weasyprint.HTML(string=html, base_url=HERE + os.sep).write_pdf(tmp)
+        else:
+            fd, source = tempfile.mkstemp(dir=directory, prefix=".range-", suffix=".html")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(html)
+            subprocess.run(
+                [executable, "--headless", "--disable-gpu", "--no-pdf-header-footer",
+                 "--print-to-pdf-no-header", f"--print-to-pdf={tmp}", pathlib.Path(source).as_uri()],
+                check=True, capture_output=True, timeout=RENDER_TIMEOUT,
+            )
+        os.replace(tmp, pdf_path)
+    finally:
+        for path in (tmp, source):
+            if path and os.path.exists(path):
+                os.unlink(path)
+    return pdf_path
+
+def find_merger():
+    """Return ``(kind, executable)`` for concatenating range PDFs: ``pypdf``, ``qpdf`` or ``pdfunite``."""
+    if pypdf is not None:
+        return "pypdf", None
+    for candidate in ("qpdf", "pdfunite"):
+        path = shutil.which(candidate)
+        if path:
+            return candidate, path
+    raise RuntimeError("no PDF merger found: install pypdf (pip install pypdf), qpdf or pdfunite")
+
+def merge_pdfs(paths, output, merger=None):
+    """Concatenate ``paths`` into ``output`` with ``merger`` (default: ``find_merger()``)."""
+    kind, executable = merger or find_merger()
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".journal-", suffix=".pdf")
+    os.close(fd)
+    try:
+        if kind == "pypdf":
+            writer = pypdf.PdfWriter()
+            for path in paths:
+                writer.append(path)
+            with open(tmp, "wb") as f:
+                writer.write(f)
+        elif kind == "qpdf":
+            subprocess.run([executable, "--empty", "--pages", *paths, "--", tmp], check=True, capture_output=True)
+        else:
+            subprocess.run([executable, *paths, tmp], check=True, capture_output=True)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, output)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def assets_digest(stylesheet=DEFAULT_STYLESHEET, fonts_dir=DEFAULT_FONTS_DIR):
+    """Hash the stylesheet and font files a printed range depends on besides its HTML."""
+    digest = hashlib.sha256()
+    paths = [stylesheet] + [find_font(fonts_dir, stem) for _family, _weight, stem in FONT_FACES]
+    for path in paths:
+        digest.update(f"{path and os.path.basename(path)}\0".encode("utf-8"))
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+class PdfExporter:
+    """Print journals to PDF, reusing range PDFs whose HTML, stylesheet and fonts have not changed.
+
+    The range cache is kept under ``max_bytes`` by ``trim()``, which evicts
+    the least recently used ranges first.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, workers=None, renderer=None,
+                 fonts_dir=DEFAULT_FONTS_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.renderer = find_renderer(renderer)
+        # Checked up front so a missing merger is reported before any range is printed
+        self.merger = find_merger()
+        self.base_href = pathlib.Path(HERE).as_uri() + "/"
+        self.assets = assets_digest(fonts_dir=fonts_dir)
+        self.max_bytes = max_bytes
+        self.ranges = 0
+        self.printed = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _range_path(self, html):
+        key = hashlib.sha256(f"{self.renderer[0]}\0{self.assets}\0{html}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".pdf")
+
+    def export(self, output, journal=None, **options):
+        """Write one journal to ``output`` from ``journal`` or ``iter_page_specs(**options)``."""
+        paths, missing = [], {}
+        for _label, html in page_ranges(self.base_href, journal, **options):
+            path = self._range_path(html)
+            paths.append(path)
+            if os.path.exists(path):
+                # Bump the mtime so trim() treats the range as recently used
+                os.utime(path)
+            else:
+                missing[path] = html
+        if missing:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(missing))) as pool:
+                futures = [pool.submit(print_range, self.renderer, html, path) for path, html in missing.items()]
+                for future in futures:
+                    future.result()
+        merge_pdfs(paths, output, self.merger)
+        self.ranges += len(paths)
+        self.printed += len(missing)
+        return output
+
+    def trim(self):
+        """Evict least recently used range PDFs until the cache fits in ``max_bytes``."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pdf") and not name.startswith("."):
+                path = os.path.join(self.cache_dir, name)
+                st = os.stat(path)
+                entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            self.evictions += 1
+        return total
+
+    def report(self):
+        return (f"PDF ranges: {self.printed} printed, {self.ranges - self.printed} reused, "
+                f"{self.evictions} evicted ({self.renderer[0]})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the journal to an A5 PDF with a headless renderer.")
+    parser.add_argument("output", help="PDF file, or a directory with --records")
+    parser.add_argument("--records", help="JSON-lines user records: write <output>/<user_id>.pdf for each")
+    parser.add_argument("--renderer", choices=("chrome", "weasyprint"), help="default: chrome if found")
+    parser.add_argument("--workers", type=int, help="ranges printed in parallel (default: up to 4)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="where printed ranges are kept")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="evict the least recently used ranges beyond this size (default 256)")
+    args = parser.parse_args()
+
+    try:
+        exporter = PdfExporter(args.cache_dir, args.workers, args.renderer,
+                               max_bytes=args.cache_max_mb * 1024 * 1024)
+    except RuntimeError as exc:
+        parser.exit(1, f"❌ {exc}\n")
+    if args.records:
+        os.makedirs(args.output, exist_ok=True)
+        try:
+            for record in read_records(args.records):
+                exporter.export(output_path(args.output, record, ".pdf"), **user_options(record))
+        except ValueError as exc:
+            parser.exit(1, f"❌ {exc}\n")
+    else:
+        exporter.export(args.output)
+    exporter.trim()
+    print(f"✅ {exporter.report()}")
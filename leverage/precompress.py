@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Precompressed Output
+Writes gzip (and, when available, brotli) copies in the same pass as the HTML
+"""
+
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+SUFFIXES = {"gzip": ".gz", "br": ".br"}
+DEFAULT_LEVELS = {"gzip": 9, "br": 11}
+
+def _compressor(encoding, level):
+    if encoding == "gzip":
+        # wbits=31 emits a gzip container with a zero mtime, so output is reproducible.
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return compressor.compress, compressor.flush
+    if encoding == "br":
+        if brotli is None:
+            raise RuntimeError("brotli output needs the optional 'brotli' package")
+        compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=level)
+        return compressor.process, compressor.finish
+    raise ValueError(f"unknown encoding {encoding!r}")
+
+class PrecompressingWriter:
+    """Binary sink that tees every write into the raw file and each compressed file.
+
+    ``outputs`` maps an encoding (``"gzip"`` or ``"br"``) to
+    ``(fileobj, level)``. Call ``close()`` to flush the compressors; the
+    underlying files are left open for the caller.
+    """
+
+    def __init__(self, raw, outputs):
+        self.raw = raw
+        self._streams = []
+        for encoding, (fileobj, level) in outputs.items():
+            compress, finish = _compressor(encoding, level)
+            self._streams.append((fileobj, compress, finish))
+
+    def write(self, data):
+        self.raw.write(data)
+        for fileobj, compress, _finish in self._streams:
+            fileobj.write(compress(data))
+        return len(data)
+
+    def close(self):
+        for fileobj, _compress, finish in self._streams:
+            fileobj.write(finish())
+        self._streams = []
+
+def remove_stale(path, keep=()):
+    """Delete compressed siblings of ``path`` for encodings not in ``keep``.
+
+    A server that prefers ``index.html.gz`` would otherwise keep serving a
+    copy of an older build. Returns the paths removed.
+    """
+    removed = []
+    for encoding, suffix in SUFFIXES.items():
+        if encoding in keep:
+            continue
+        try:
+            os.unlink(path + suffix)
+        except FileNotFoundError:
+            continue
+        removed.append(path + suffix)
+    return removed
+
+def compression_report(sizes, path):
+    """One line per compressed sibling of ``path`` with its size and ratio."""
+    raw = sizes[path]
+    lines = []
+    for target, size in sizes.items():
+        if target != path:
+            ratio = raw / size if size else 0.0
+            lines.append(f"{target}: {size / 1024:.1f} KB ({ratio:.1f}x, {size / raw * 100:.1f}% of original)")
+    return lines
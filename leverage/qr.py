@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - QR Codes
+Pure-Python QR encoder (byte mode, versions 1-10) rendered as SVG paths, cached by URL
+"""
+
+import json
+import os
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MANIFEST = os.path.join(HERE, "..", "public", "leverage", "qr-codes", "manifest.json")
+CACHE_PATH = os.path.join(HERE, "build", "qr-cache.json")
+# Bump when the encoder or SVG output changes so cached codes are re-encoded
+ENCODER_VERSION = 2
+# Light border around the symbol, in modules; ISO/IEC 18004 requires at least 4
+QUIET_ZONE = 4
+
+_ECC_FORMAT_BITS = {"L": 1, "M": 0, "Q": 3, "H": 2}
+
+# Per version and error-correction level: (EC codewords per block,
+# blocks in group 1, data codewords per group-1 block, blocks in group 2,
+# data codewords per group-2 block)
+_BLOCKS = {
+    1: {"L": (7, 1, 19, 0, 0), "M": (10, 1, 16, 0, 0), "Q": (13, 1, 13, 0, 0), "H": (17, 1, 9, 0, 0)},
+    2: {"L": (10, 1, 34, 0, 0), "M": (16, 1, 28, 0, 0), "Q": (22, 1, 22, 0, 0), "H": (28, 1, 16, 0, 0)},
+    3: {"L": (15, 1, 55, 0, 0), "M": (26, 1, 44, 0, 0), "Q": (18, 2, 17, 0, 0), "H": (22, 2, 13, 0, 0)},
+    4: {"L": (20, 1, 80, 0, 0), "M": (18, 2, 32, 0, 0), "Q": (26, 2, 24, 0, 0), "H": (16, 4, 9, 0, 0)},
+    5: {"L": (26, 1, 108, 0, 0), "M": (24, 2, 43, 0, 0), "Q": (18, 2, 15, 2, 16), "H": (22, 2, 11, 2, 12)},
+    6: {"L": (18, 2, 68, 0, 0), "M": (16, 4, 27, 0, 0), "Q": (24, 4, 19, 0, 0), "H": (28, 4, 15, 0, 0)},
+    7: {"L": (20, 2, 78, 0, 0), "M": (18, 4, 31, 0, 0), "Q": (18, 2, 14, 4, 15), "H": (26, 4, 13, 1, 14)},
+    8: {"L": (24, 2, 97, 0, 0), "M": (22, 2, 38, 2, 39), "Q": (22, 4, 18, 2, 19), "H": (26, 4, 14, 2, 15)},
+    9: {"L": (30, 2, 116, 0, 0), "M": (22, 3, 36, 2, 37), "Q": (20, 4, 16, 4, 17), "H": (24, 4, 12, 4, 13)},
+    10: {"L": (18, 2, 68, 2, 69), "M": (26, 4, 43, 1, 44), "Q": (24, 6, 19, 2, 20), "H": (28, 6, 15, 2, 16)},
+}
+
+_ALIGNMENT = {
+    1: (), 2: (6, 18), 3: (6, 22), 4: (6, 26), 5: (6, 30),
+    6: (6, 34), 7: (6, 22, 38), 8: (6, 24, 42), 9: (6, 26, 46), 10: (6, 28, 50),
+}
+
+_MASKS = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+def _gf_mul(x, y):
+    z = 0
+    for i in reversed(range(8)):
+        z = (z << 1) ^ ((z >> 7) * 0x11D)
+        z ^= ((y >> i) & 1) * x
+    return z
+
+def _rs_divisor(degree):
+    result = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = _gf_mul(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = _gf_mul(root, 0x02)
+    return result
+
+def _rs_remainder(data, divisor):
+    result = [0] * len(divisor)
+    for byte in data:
+        factor = byte ^ result.pop(0)
+        result.append(0)
+        for i, coef in enumerate(divisor):
+            result[i] ^= _gf_mul(coef, factor)
+    return result
+
+def _data_capacity(version, ecc):
+    _ec, blocks1, data1, blocks2, data2 = _BLOCKS[version][ecc]
+    return blocks1 * data1 + blocks2 * data2
+
+def _codewords(data, version, ecc):
+    """Data bits in byte mode, padded, split into blocks and interleaved with their EC codewords."""
+    capacity = _data_capacity(version, ecc)
+    bits = [0, 1, 0, 0]
+    count_bits = 8 if version < 10 else 16
+    bits += [(len(data) >> i) & 1 for i in reversed(range(count_bits))]
+    for byte in data:
+        bits += [(byte >> i) & 1 for i in reversed(range(8))]
+    bits += [0] * min(4, capacity * 8 - len(bits))
+    bits += [0] * (-len(bits) % 8)
+    codewords = [int("".join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits), 8)]
+    pad = 0xEC
+    while len(codewords) < capacity:
+        codewords.append(pad)
+        pad ^= 0xEC ^ 0x11
+
+    ec_len, blocks1, data1, blocks2, data2 = _BLOCKS[version][ecc]
+    divisor = _rs_divisor(ec_len)
+    blocks, ec_blocks, start = [], [], 0
+    for size in [data1] * blocks1 + [data2] * blocks2:
+        block = codewords[start:start + size]
+        start += size
+        blocks.append(block)
+        ec_blocks.append(_rs_remainder(block, divisor))
+    result = []
+    for i in range(max(data1, data2)):
+        result += [block[i] for block in blocks if i < len(block)]
+    for i in range(ec_len):
+        result += [block[i] for block in ec_blocks]
+    return result
+
+class _Matrix:
+    def __init__(self, version):
+        self.version = version
+        self.size = version * 4 + 17
+        self.modules = [[False] * self.size for _ in range(self.size)]
+        self.function = [[False] * self.size for _ in range(self.size)]
+
+    def set_function(self, x, y, dark):
+        self.modules[y][x] = dark
+        self.function[y][x] = True
+
+    def draw_function_patterns(self):
+        size = self.size
+        for i in range(size):
+            self.set_function(6, i, i % 2 == 0)
+            self.set_function(i, 6, i % 2 == 0)
+        for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+            for dy in range(-4, 5):
+                for dx in range(-4, 5):
+                    x, y = cx + dx, cy + dy
+                    if 0 <= x < size and 0 <= y < size:
+                        self.set_function(x, y, max(abs(dx), abs(dy)) not in (2, 4))
+        positions = _ALIGNMENT[self.version]
+        last = len(positions) - 1
+        for i, cx in enumerate(positions):
+            for j, cy in enumerate(positions):
+                if (i, j) in ((0, 0), (0, last), (last, 0)):
+                    continue
+                for dy in range(-2, 3):
+                    for dx in range(-2, 3):
+                        self.set_function(cx + dx, cy + dy, max(abs(dx), abs(dy)) != 1)
+        self.draw_format(0, "L")
+        self.draw_version()
+
+    def draw_format(self, mask, ecc):
+        data = _ECC_FORMAT_BITS[ecc] << 3 | mask
+        rem = data
+        for _ in range(10):
+            rem = (rem << 1) ^ ((rem >> 9) * 0x537)
+        bits = (data << 10 | rem) ^ 0x5412
+        bit = lambda i: (bits >> i) & 1 == 1
+        size = self.size
+        for i in range(6):
+            self.set_function(8, i, bit(i))
+        self.set_function(8, 7, bit(6))
+        self.set_function(8, 8, bit(7))
+        self.set_function(7, 8, bit(8))
+        for i in range(9, 15):
+            self.set_function(14 - i, 8, bit(i))
+        for i in range(8):
+            self.set_function(size - 1 - i, 8, bit(i))
+        for i in range(8, 15):
+            self.set_function(8, size - 15 + i, bit(i))
+        self.set_function(8, size - 8, True)
+
+    def draw_version(self):
+        if self.version < 7:
+            return
+        rem = self.version
+        for _ in range(12):
+            rem = (rem << 1) ^ ((rem >> 11) * 0x1F25)
+        bits = self.version << 12 | rem
+        for i in range(18):
+            dark = (bits >> i) & 1 == 1
+            a, b = self.size - 11 + i % 3, i // 3
+            self.set_function(a, b, dark)
+            self.set_function(b, a, dark)
+
+    def place(self, codewords):
+        size, i, total = self.size, 0, len(codewords) * 8
+        right = size - 1
+        while right >= 1:
+            if right == 6:
+                right = 5
+            upward = (right + 1) & 2 == 0
+            for vert in range(size):
+                y = size - 1 - vert if upward else vert
+                for x in (right, right - 1):
+                    if not self.function[y][x] and i < total:
+                        self.modules[y][x] = (codewords[i >> 3] >> (7 - (i & 7))) & 1 == 1
+                        i += 1
+            right -= 2
+
+    def apply_mask(self, mask):
+        test = _MASKS[mask]
+        for y in range(self.size):
+            row, function = self.modules[y], self.function[y]
+            for x in range(self.size):
+                if not function[x] and test(x, y):
+                    row[x] = not row[x]
+
+def _penalty(modules):
+    size = len(modules)
+    lines = [modules[y] for y in range(size)] + [[modules[y][x] for y in range(size)] for x in range(size)]
+    score = 0
+    for line in lines:
+        run = 1
+        for prev, cur in zip(line, line[1:]):
+            if cur == prev:
+                run += 1
+            else:
+                if run >= 5:
+                    score += run - 2
+                run = 1
+        if run >= 5:
+            score += run - 2
+        text = "".join("1" if dark else "0" for dark in line)
+        for pattern in ("10111010000", "00001011101"):
+            start = text.find(pattern)
+            while start != -1:
+                score += 40
+                start = text.find(pattern, start + 1)
+    for y in range(size - 1):
+        for x in range(size - 1):
+            if modules[y][x] == modules[y][x + 1] == modules[y + 1][x] == modules[y + 1][x + 1]:
+                score += 3
+    dark = sum(map(sum, modules))
+    total = size * size
+    score += ((abs(dark * 20 - total * 10) + total - 1) // total - 1) * 10
+    return score
+
+def encode(text, ecc="H"):
+    """Encode ``text`` (UTF-8, byte mode) as a matrix of rows; ``True`` is a dark module."""
+    data = text.encode("utf-8")
+    for version in _BLOCKS:
+        count_bits = 8 if version < 10 else 16
+        if 4 + count_bits + len(data) * 8 <= _data_capacity(version, ecc) * 8:
+            break
+    else:
+        raise ValueError(f"{len(data)} bytes do not fit a version 1-10 QR code at level {ecc}")
+
+    matrix = _Matrix(version)
+    matrix.draw_function_patterns()
+    matrix.place(_codewords(data, version, ecc))
+    best = None
+    for mask in range(8):
+        matrix.apply_mask(mask)
+        matrix.draw_format(mask, ecc)
+        score = _penalty(matrix.modules)
+        if best is None or score < best[0]:
+            best = (score, mask)
+        matrix.apply_mask(mask)
+    matrix.apply_mask(best[1])
+    matrix.draw_format(best[1], ecc)
+    return matrix.modules
+
+def svg_path(modules):
+    """Dark modules as one path of horizontal runs, offset by the quiet zone."""
+    commands = []
+    for y, row in enumerate(modules):
+        x, last = 0, None
+        while x < len(row):
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < len(row) and row[x]:
+                x += 1
+            # After "z" the pen is back at the run's start, so later runs on the row move relatively
+            move = f"M{start + QUIET_ZONE} {y + QUIET_ZONE}" if last is None else f"m{start - last} 0"
+            commands.append(f"{move}h{x - start}v1h-{x - start}z")
+            last = start
+    return "".join(commands)
+
+class QrCache:
+    """Encoded codes keyed by URL and error-correction level, persisted as JSON."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.encoded = 0
+        self._dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (FileNotFoundError, ValueError):
+            stored = {}
+        self._codes = stored.get("codes", {}) if stored.get("version") == ENCODER_VERSION else {}
+
+    def get(self, url, ecc="H"):
+        """Return ``(size_in_modules_with_quiet_zone, svg_path_data)`` for ``url``."""
+        key = f"{ecc}:{url}"
+        code = self._codes.get(key)
+        if code is None:
+            modules = encode(url, ecc)
+            code = self._codes[key] = [len(modules) + 2 * QUIET_ZONE, svg_path(modules)]
+            self.encoded += 1
+            self._dirty = True
+        return tuple(code)
+
+    def save(self):
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": ENCODER_VERSION, "codes": self._codes}, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError:
+            # A read-only checkout still builds; the codes are just re-encoded next time.
+            return
+        self._dirty = False
+
+def load_manifest(path=MANIFEST):
+    """Map manifest ids (``chapter1``..) to their entries; empty when the manifest is missing."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {code["id"]: code for code in json.load(f)["qrCodes"]}
+    except FileNotFoundError:
+        return {}
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Quote Corpus
+Reads quotes from an external JSON-lines corpus through a memory-mapped offset index
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"LJQI"
+INDEX_VERSION = 1
+# magic, version, record count, corpus size, corpus mtime (ns)
+_HEADER = struct.Struct("<4sIQQQ")
+_OFFSET = struct.Struct("<Q")
+
+class CorpusError(ValueError):
+    """A corpus record that cannot be used, named by corpus path and record number."""
+
+def index_path(path):
+    return path + INDEX_SUFFIX
+
+def build_index(path, index=None):
+    """Write the offset index for the corpus at ``path`` in one streaming pass.
+
+    Every non-blank line that does not start with ``#`` is one record: a
+    JSON object with ``text`` (and ``author`` for quotes) or a bare JSON
+    string. The index holds a fixed header and one little-endian 64-bit
+    start offset per record. Returns the number of records.
+    """
+    index = index or index_path(path)
+    stat = os.stat(path)
+    count = 0
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(index)), suffix=".tmp")
+    try:
+        with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            dst.write(b"\0" * _HEADER.size)
+            offset = 0
+            for line in src:
+                stripped = line.strip()
+                if stripped and not stripped.startswith(b"#"):
+                    dst.write(_OFFSET.pack(offset))
+                    count += 1
+                offset += len(line)
+            dst.seek(0)
+            dst.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, count, stat.st_size, stat.st_mtime_ns))
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, index)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return count
+
+def _index_is_current(index, path):
+    try:
+        with open(index, "rb") as f:
+            header = f.read(_HEADER.size)
+    except FileNotFoundError:
+        return False
+    if len(header) != _HEADER.size:
+        return False
+    magic, version, _count, size, mtime_ns = _HEADER.unpack(header)
+    stat = os.stat(path)
+    return (magic, version, size, mtime_ns) == (INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns)
+
+class Rotation:
+    """A seeded permutation of ``range(count)`` evaluated one position at a time.
+
+    Position ``n`` maps to ``(offset + step * n) % count`` with ``step``
+    coprime to ``count``, so every record comes up once per cycle and no
+    table of ``count`` entries is ever built. Without a seed the rotation
+    is plain ``n % count``.
+    """
+
+    def __init__(self, count, seed=None):
+        if count < 1:
+            raise ValueError("cannot rotate an empty sequence")
+        self.count = count
+        if seed is None:
+            self.offset, self.step = 0, 1
+            return
+        digest = hashlib.sha256(str(seed).encode("utf-8")).digest()
+        self.offset = int.from_bytes(digest[:8], "little") % count
+        step = int.from_bytes(digest[8:16], "little") % count or 1
+        while math.gcd(step, count) != 1:
+            step += 1
+        self.step = step
+
+    def __getitem__(self, n):
+        return (self.offset + self.step * n) % self.count
+
+class QuoteCorpus:
+    """Random access to the records of a JSON-lines corpus without loading it.
+
+    The corpus and its index are memory-mapped; looking up record ``n``
+    reads one offset from the index and parses one line. A missing or
+    stale index (the corpus size or mtime changed) is rebuilt on open.
+    """
+
+    def __init__(self, path, index=None):
+        self.path = path
+        self.index_path = index or index_path(path)
+        if not _index_is_current(self.index_path, path):
+            build_index(path, self.index_path)
+        try:
+            self._corpus_file = open(path, "rb")
+            self._index_file = open(self.index_path, "rb")
+            self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.count = _HEADER.unpack_from(self._index)[2]
+            if not self.count:
+                raise ValueError(f"quote corpus {path} has no records")
+            self._corpus = mmap.mmap(self._corpus_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, n):
+        if not 0 <= n < self.count:
+            raise IndexError(f"quote {n} out of range (corpus has {self.count})")
+        start = _OFFSET.unpack_from(self._index, _HEADER.size + n * _OFFSET.size)[0]
+        end = self._corpus.find(b"\n", start)
+        line = self._corpus[start:end if end >= 0 else len(self._corpus)]
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise CorpusError(f"{self.path}: record {n} is not valid JSON ({exc})") from None
+        if not isinstance(record, str) and not (isinstance(record, dict) and isinstance(record.get("text"), str)):
+            raise CorpusError(f"{self.path}: record {n} is neither a string nor an object with a text")
+        return record
+
+    def close(self):
+        # Maps before the files they were made from; any may be missing if __init__ failed
+        for name in ("_corpus", "_index", "_corpus_file", "_index_file"):
+            handle = getattr(self, name, None)
+            if handle is not None:
+                handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def write_corpus(path, records):
+    """Write ``records`` as a JSON-lines corpus and index it."""
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return build_index(path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build and query quote corpora for the journal generator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    index_cmd = commands.add_parser("index", help="(re)build the offset index of a corpus")
+    index_cmd.add_argument("corpus")
+    get_cmd = commands.add_parser("get", help="print records by number")
+    get_cmd.add_argument("corpus")
+    get_cmd.add_argument("numbers", type=int, nargs="+")
+    export_cmd = commands.add_parser("export", help="write the built-in quotes or footer wisdom as a corpus")
+    export_cmd.add_argument("corpus")
+    export_cmd.add_argument("--wisdom", action="store_true", help="export FOOTER_WISDOM instead of QUOTES")
+    args = parser.parse_args()
+
+    if args.command == "index":
+        print(f"✅ Indexed {build_index(args.corpus)} records → {index_path(args.corpus)}")
+    elif args.command == "get":
+        with QuoteCorpus(args.corpus) as corpus:
+            for n in args.numbers:
+                try:
+                    print(json.dumps(corpus[n], ensure_ascii=False))
+                except IndexError as exc:
+                    sys.exit(f"❌ {exc}")
+    else:
+        from generate import FOOTER_WISDOM, QUOTES
+        count = write_corpus(args.corpus, FOOTER_WISDOM if args.wisdom else QUOTES)
+        print(f"✅ Wrote {count} records → {args.corpus}")
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Local Render Server
+One warm asyncio process that renders journals on request and streams the HTML back
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from batch import user_options
+from generate import PARALLEL_MIN_PAGES, chunk_specs, iter_page_specs, render_chunk
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_HEADER_LINES = 100
+
+_PERSONAL_OPTIONS = set(user_options({}))
+# Quote corpora are files on the render host, not something a request may pick
+_HOST_OPTIONS = {"quotes", "wisdom"}
+VARIANT_OPTIONS = frozenset(inspect.signature(iter_page_specs).parameters) - _PERSONAL_OPTIONS - _HOST_OPTIONS
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def parse_render_request(body):
+    """Turn a JSON request body into ``iter_page_specs`` keyword options.
+
+    The body is a user record (``journal_entries``, ``weekly_reviews``,
+    ``goals``, ``foundation``) plus an optional ``options`` object of
+    build-variant settings. An empty body renders the blank journal.
+    """
+    if not body.strip():
+        return {}
+    try:
+        request = json.loads(body)
+    except ValueError as exc:
+        raise HTTPError(400, f"invalid JSON: {exc}") from None
+    if not isinstance(request, dict):
+        raise HTTPError(400, "request body must be a JSON object")
+
+    variant = request.get("options") or {}
+    if not isinstance(variant, dict):
+        raise HTTPError(400, "options must be a JSON object")
+    unknown = set(variant) - VARIANT_OPTIONS
+    if unknown:
+        raise HTTPError(400, f"unknown options: {', '.join(sorted(unknown))}")
+    options = {key: value for key, value in user_options(request).items() if value}
+    options.update(variant)
+    return options
+
+class RenderServer:
+    """Render journals off the event loop, capping how many renders run at once.
+
+    Journals are rendered serially on a thread; only jobs of at least
+    ``PARALLEL_MIN_PAGES`` pages are split across the process pool, the
+    same rule ``generate.iter_pages`` follows.
+    """
+
+    def __init__(self, workers=None, max_concurrent=4):
+        self.workers = min(workers or os.cpu_count() or 1, os.cpu_count() or 1)
+        self.max_concurrent = max_concurrent
+        self.pool = None
+        self._slots = None
+
+    async def start(self, host="127.0.0.1", port=8765):
+        if self.workers > 1:
+            # Spawned workers start clean; forked ones would inherit the
+            # listening socket and every client connection open at the time
+            self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        return await asyncio.start_server(self.handle, host, port)
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def _read_request(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        if not request_line:
+            raise HTTPError(400, "empty request")
+        try:
+            method, target, _version = request_line.split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "malformed request line") from None
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HTTPError(400, "too many headers")
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise HTTPError(400, "invalid Content-Length") from None
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, "request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method, target.split("?", 1)[0], body
+
+    async def _respond(self, writer, status, body, content_type="text/plain; charset=utf-8"):
+        data = body.encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n".encode("latin-1") + data
+        )
+        await writer.drain()
+
+    async def render(self, options, writer):
+        """Render one journal and stream it as a chunked HTTP response."""
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            try:
+                specs = await loop.run_in_executor(None, lambda: list(iter_page_specs(**options)))
+            except (AttributeError, KeyError, TypeError, ValueError) as exc:
+                raise HTTPError(400, f"invalid render request: {exc!r}") from None
+            if self.pool and len(specs) >= PARALLEL_MIN_PAGES:
+                chunks = [loop.run_in_executor(self.pool, render_chunk, chunk)
+                          for chunk in chunk_specs(specs, self.workers)]
+            else:
+                # Lazily, one after the other, so only the chunk being sent is held
+                chunks = (loop.run_in_executor(None, render_chunk, chunk)
+                          for chunk in chunk_specs(specs, 1))
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/html; charset=utf-8\r\n"
+                b"Transfer-Encoding: chunked\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            try:
+                for future in chunks:
+                    markup = await future
+                    data = markup.encode("utf-8")
+                    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                    await writer.drain()
+            except (ConnectionError, asyncio.CancelledError):
+                raise
+            except Exception as exc:
+                # The 200 is already sent; dropping the connection without the
+                # last chunk is how the client learns the body is incomplete
+                print(f"❌ Render failed mid-response: {exc!r}", file=sys.stderr)
+                writer.transport.abort()
+                return
+            finally:
+                if isinstance(chunks, list):
+                    for future in chunks:
+                        future.cancel()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+    async def handle(self, reader, writer):
+        try:
+            method, path, body = await self._read_request(reader)
+            if path == "/health":
+                await self._respond(writer, 200, "ok")
+            elif path != "/render":
+                raise HTTPError(404, f"no route for {path}")
+            elif method not in ("GET", "POST"):
+                raise HTTPError(405, "use GET or POST")
+            else:
+                await self.render(parse_render_request(body), writer)
+        except HTTPError as exc:
+            await self._respond(writer, exc.status, str(exc))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+async def serve(host, port, workers, max_concurrent):
+    server = RenderServer(workers, max_concurrent)
+    listener = await server.start(host, port)
+    print(f"✅ Rendering journals on http://{host}:{port}/render "
+          f"({server.workers} workers, {max_concurrent} concurrent renders)")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve journal renders over HTTP from one warm process.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="render processes for very large jobs (default: CPU count)")
+    parser.add_argument("--max-concurrent", type=int, default=4, help="renders in flight at once")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_concurrent))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Sharded Output
+Splits the journal into per-section HTML shards behind a small index and lazy loader
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from generate import TEMPLATE_SECTIONS, iter_page_specs, render_chunk
+from incremental import remove_index
+from precompress import remove_stale
+from templates import REGISTRY
+
+SHARD_DIR = "shards"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+# Sections rendered straight into the index so first paint needs no fetch
+FIRST_PAINT = ("cover", "commitment")
+DAYS_PER_SHARD = 7
+
+_SHARD_FILE = re.compile(r"^[\w-]+\.[0-9a-f]{12}\.html$")
+
+def shard_of(name, values):
+    """Shard a page spec belongs to, or None when it stays in the index."""
+    section = TEMPLATE_SECTIONS[name]
+    if section in FIRST_PAINT or "page" not in values:
+        return None
+    if section == "days":
+        # The DO divider has no day and opens the first week
+        return f"days-week-{(values.get('day', 1) - 1) // DAYS_PER_SHARD + 1:02d}"
+    return section
+
+def group_specs(specs):
+    """Split page specs into ``(index_specs, [(shard, specs), ...])`` in page order."""
+    index_specs, shards = [], {}
+    for name, values in specs:
+        shard = shard_of(name, values)
+        if shard is None:
+            index_specs.append((name, values))
+        else:
+            shards.setdefault(shard, []).append((name, values))
+    return index_specs, list(shards.items())
+
+def _render_groups(groups, workers):
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(render_chunk, groups))
+    get = REGISTRY.get
+    return ["".join(get(name).render(**values) for name, values in group) for group in groups]
+
+def _write_file(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".shard-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def write_sharded(path, workers=None, **options):
+    """Write the cover and commitment pages to ``path`` and every other section as a shard.
+
+    Shards go to ``shards/<name>.<hash>.html`` beside ``path``, together
+    with ``shards/manifest.json``. Shard file names carry a content hash,
+    so they can be served with long cache lifetimes and an unchanged shard
+    is not rewritten. The index is replaced last, after which shards no
+    longer listed in the manifest are removed. Returns the manifest.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    shard_dir = os.path.join(directory, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+
+    index_specs, shards = group_specs(iter_page_specs(**options))
+    # The document tail is held back so the slots and loader go before it
+    *first_paint, (tail_name, tail_values) = index_specs
+    markups = _render_groups([first_paint] + [specs for _shard, specs in shards], workers)
+
+    manifest = {"version": MANIFEST_VERSION, "index": os.path.basename(path), "shards": []}
+    slots = []
+    for (shard, specs), markup in zip(shards, markups[1:]):
+        data = markup.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        filename = f"{shard}.{digest[:12]}.html"
+        if not os.path.exists(os.path.join(shard_dir, filename)):
+            _write_file(os.path.join(shard_dir, filename), data)
+        first, last = int(specs[0][1]["page"]), int(specs[-1][1]["page"])
+        src = f"{SHARD_DIR}/{filename}"
+        manifest["shards"].append({"name": shard, "src": src, "first_page": first, "last_page": last,
+                                   "bytes": len(data), "sha256": digest})
+        slots.append(REGISTRY.render("shard_slot", src=src, pages=f"{first}-{last}", count=len(specs)))
+
+    index = (markups[0] + "".join(slots) + REGISTRY.render("shard_loader")
+             + REGISTRY.render(tail_name, **tail_values))
+
+    _write_file(os.path.join(shard_dir, MANIFEST_NAME),
+                (json.dumps(manifest, indent=2) + "\n").encode("utf-8"))
+    _write_file(os.path.abspath(path), index.encode("utf-8"))
+    remove_stale(os.path.abspath(path))
+    remove_index(os.path.abspath(path))
+
+    listed = {os.path.basename(shard["src"]) for shard in manifest["shards"]}
+    for filename in os.listdir(shard_dir):
+        if _SHARD_FILE.match(filename) and filename not in listed:
+            os.unlink(os.path.join(shard_dir, filename))
+    return manifest
@@ -0,0 +1,1063 @@
+#!/usr/bin/env python3
+"""
+The Leverage Journal™ - Page Template Registry
+Every page kind is compiled once into static segments and named slots
+"""
+
+import hashlib
+import re
+from collections import Counter
+from functools import lru_cache
+
+from qr import QrCache, load_manifest
+
+_SLOT = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_SYMBOL_DEF = re.compile(r'<symbol id="([\w-]+)"')
+_SYMBOL_USE = re.compile(r'<use href="#([\w-]+)"')
+
+class PageTemplate:
+    """A page template split into literal segments around ``{{slot}}`` markers."""
+
+    __slots__ = ("name", "source", "digest", "segments", "slots", "_parts", "_positions")
+
+    def __init__(self, name, source):
+        parts = _SLOT.split(source)
+        self.name = name
+        self.source = source
+        self.digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        self.segments = tuple(parts[0::2])
+        self.slots = tuple(parts[1::2])
+        # Odd positions of ``parts`` are slot names; rendering overwrites them.
+        self._parts = parts
+        self._positions = tuple((i, parts[i]) for i in range(1, len(parts), 2))
+
+    def render(self, **values):
+        """Fill the slots and return the page markup."""
+        if not self._positions:
+            return self.segments[0]
+        parts = self._parts[:]
+        try:
+            for i, slot in self._positions:
+                parts[i] = str(values[slot])
+        except KeyError as exc:
+            raise KeyError(f"template {self.name!r} is missing slot {exc.args[0]!r}") from None
+        return "".join(parts)
+
+class TemplateRegistry:
+    """Named collection of compiled page templates.
+
+    ``register`` also takes a callable returning the source, for templates
+    that need work (QR encoding) best left until a build first uses them;
+    those are compiled on their first ``get``.
+    """
+
+    def __init__(self):
+        self._names = []
+        self._templates = {}
+        self._pending = {}
+
+    def register(self, name, source):
+        if name in self._templates or name in self._pending:
+            raise ValueError(f"template {name!r} is already registered")
+        self._names.append(name)
+        if callable(source):
+            self._pending[name] = source
+            return None
+        template = PageTemplate(name, source)
+        self._templates[name] = template
+        return template
+
+    def get(self, name):
+        try:
+            return self._templates[name]
+        except KeyError:
+            if name not in self._pending:
+                raise
+        template = self._templates[name] = PageTemplate(name, self._pending.pop(name)())
+        return template
+
+    __getitem__ = get
+
+    def __contains__(self, name):
+        return name in self._templates or name in self._pending
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def render(self, name, **values):
+        return self.get(name).render(**values)
+
+class SvgSprite:
+    """Icons defined once as ``<symbol>`` elements and drawn with ``<use>``."""
+
+    def __init__(self):
+        self._symbols = {}
+
+    def define(self, symbol_id, view_box, body):
+        if symbol_id in self._symbols:
+            raise ValueError(f"symbol {symbol_id!r} is already defined")
+        self._symbols[symbol_id] = (view_box, body)
+
+    def __contains__(self, symbol_id):
+        return symbol_id in self._symbols
+
+    def use(self, symbol_id, width, height):
+        view_box = self._symbols[symbol_id][0]
+        return (f'<svg width="{width}" height="{height}" viewBox="{view_box}" aria-hidden="true">'
+                f'<use href="#{symbol_id}"/></svg>')
+
+    def markup(self, symbol_ids=None):
+        """The sprite ``<svg>``, limited to ``symbol_ids`` when given (in definition order)."""
+        symbols = "".join(f'<symbol id="{symbol_id}" viewBox="{view_box}">{body}</symbol>'
+                          for symbol_id, (view_box, body) in self._symbols.items()
+                          if symbol_ids is None or symbol_id in symbol_ids)
+        return (f'<svg width="0" height="0" '
+                f'style="position: absolute;" aria-hidden="true"><defs>{symbols}</defs></svg>')
+
+    def used_by(self, registry, skip=()):
+        """Ids of the symbols the templates of ``registry`` (except ``skip``) draw with ``<use>``."""
+        return {symbol_id for name in registry if name not in skip
+                for symbol_id in _SYMBOL_USE.findall(registry.get(name).source)}
+
+    def check(self, registry):
+        """Raise ValueError unless no symbol is emitted twice and every ``<use>`` resolves."""
+        sources = [registry.get(name).source for name in registry]
+        defined = Counter(symbol_id for source in sources for symbol_id in _SYMBOL_DEF.findall(source))
+        for symbol_id, count in defined.items():
+            if count != 1:
+                raise ValueError(f"symbol {symbol_id!r} is defined {count} times")
+        for source in sources:
+            for symbol_id in _SYMBOL_USE.findall(source):
+                if symbol_id not in defined:
+                    raise ValueError(f"<use> references undefined symbol {symbol_id!r}")
+
+REGISTRY = TemplateRegistry()
+
+_GRID_CELLS = '<div class="grid-cell"></div>' * 21
+
+# Shared icons, emitted once as a sprite right after <body>
+SPRITE = SvgSprite()
+SPRITE.define("icon-star-cover", "0 0 24 24",
+              '<path fill="#FFD700" d="M12 2L15.09 8.26L22 9.27L17 14.14L18.18 21.02L12 17.77L5.82 21.02L7 14.14L2 9.27L8.91 8.26L12 2Z"/>')
+SPRITE.define("icon-star", "0 0 24 24",
+              '<path fill="#FFD700" d="M12 2L15 9L22 9L17 14L19 21L12 17L5 21L7 14L2 9L9 9L12 2Z"/>')
+SPRITE.define("icon-star-do", "0 0 24 24",
+              '<path fill="#FFD700" d="M12 2L14 8H20L15 12L17 18L12 14L7 18L9 12L4 8H10L12 2Z"/>')
+SPRITE.define("icon-star-achieve", "0 0 24 24",
+              '<path fill="#FFD700" d="M12 2L15 8L22 9L17 14L18 21L12 18L6 21L7 14L2 9L9 8L12 2Z"/>')
+SPRITE.define("icon-clock", "0 0 24 24",
+              '<circle cx="12" cy="12" r="10" stroke="#FFD700" stroke-width="1.5" fill="none"/>'
+              '<path fill="#FFD700" d="M12 6L12 12L16 14"/>')
+SPRITE.define("qr-frame", "0 0 100 100", '<rect width="100" height="100" fill="var(--black-soft)"/>')
+
+def _qr_placeholder(size, label, x, y, font_size, font_family=None):
+    """QR placeholder: the shared frame scaled to ``size`` with its label drawn on top."""
+    family = f' font-family="{font_family}"' if font_family else ""
+    return (f'<svg width="{size}" height="{size}" viewBox="0 0 {size} {size}" aria-hidden="true">'
+            f'<use href="#qr-frame" width="{size}" height="{size}"/>'
+            f'<text x="{x}" y="{y}" text-anchor="middle" fill="var(--gold)" opacity="0.2" '
+            f'font-size="{font_size}"{family}>{label}</text></svg>')
+
+@lru_cache(maxsize=None)
+def _qr_symbols():
+    """Encode the codes in public/leverage/qr-codes/manifest.json into sprite symbols.
+
+    Runs once, when the first template showing a code is compiled, so
+    importing this module reads and writes no files. Returns manifest id
+    -> symbol id; ids sharing a URL share one symbol.
+    """
+    cache = QrCache()
+    symbols, by_url = {}, {}
+    for code_id, code in load_manifest().items():
+        if code["url"] not in by_url:
+            modules, path = cache.get(code["url"])
+            by_url[code["url"]] = f"qr-{code_id}"
+            SPRITE.define(f"qr-{code_id}", f"0 0 {modules} {modules}",
+                          f'<rect width="{modules}" height="{modules}" fill="#FFFFFF"/><path fill="#000000" d="{path}"/>')
+        symbols[code_id] = by_url[code["url"]]
+    cache.save()
+    return symbols
+
+def _qr_code(code_id, size, placeholder):
+    """The manifest's code for ``code_id``, or ``placeholder`` when the manifest does not list it."""
+    symbol_id = _qr_symbols().get(code_id)
+    return SPRITE.use(symbol_id, size, size) if symbol_id else placeholder
+
+def _document_head():
+    # The sprite carries the QR symbols, so they are encoded before it is built;
+    # only symbols some page draws are emitted, so qr-frame is left out while
+    # the manifest has every code
+    _qr_symbols()
+    used = SPRITE.used_by(REGISTRY, skip=("document_head",))
+    return '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>The Leverage Journal™ - Plan • Do • Achieve</title>
+    <link rel="stylesheet" href="css/journal.css">
+</head>
+<body>
+''' + SPRITE.markup(used) + '''
+
+'''
+
+# Document head
+REGISTRY.register("document_head", _document_head)
+
+# Page 1: cover
+REGISTRY.register("cover", lambda: '''<!-- PAGE {{page}}: COVER -->
+<div class="page flex flex-col items-center justify-center">
+    <div class="mb-8">
+        ''' + SPRITE.use("icon-star-cover", 70, 70) + '''
+    </div>
+    
+    <h1 class="font-serif text-center mb-6 gold-gradient" style="font-size: 3.2em; line-height: 1.2;">
+        THE LEVERAGE<br>JOURNAL™
+    </h1>
+    
+    <div class="gold-line" style="width: 160px;"></div>
+    
+    <p class="text-xl tracking-widest mt-8 text-center uppercase" style="color: var(--gray);">Build Your Empire</p>
+    <p class="text-sm tracking-wider mt-4 gold-gradient font-semibold">Plan • Do • Achieve</p>
+    
+    <div class="qr-placeholder mt-16">
+        ''' + _qr_code("chapter1", 110, _qr_placeholder(110, "SCAN", 55, 60, 12, "Cormorant Garamond")) + '''
+    </div>
+    <p class="qr-text">Scan to unlock the app</p>
+    
+    <div style="position: absolute; bottom: 18mm; text-align: center; width: 100%;">
+        <p class="text-xs tracking-wider" style="color: var(--gray);">LEVERAGE APP © 2025</p>
+    </div>
+</div>
+
+''')
+
+# Page 2: my commitment
+REGISTRY.register("commitment", '''<!-- PAGE {{page}}: MY COMMITMENT TO SUCCESS -->
+<div class="page">
+    <div class="section-icon">
+        ''' + SPRITE.use("icon-star", 50, 50) + '''
+    </div>
+    <h1 class="text-center gold-gradient" style="font-size: 1.8em;">My Commitment</h1>
+    
+    <div class="quote-box mt-8" style="font-size: 0.9em;">
+        I vow to use this journal consistently, marking the beginning of real change in my life.
+        <br><br>
+        From today, I'm choosing to push myself. I'll face challenges head-on and learn from my mistakes. Each day is a chance to get better, and I intend to make the most of it.
+        <br><br>
+        I'm going to make myself proud. Not with grand gestures, but with consistent effort and honest reflection.
+        <br><br>
+        <strong class="not-italic" style="color: var(--gold-metallic);">This is my path. My choice. My future.</strong>
+        <br><br>
+        I'm ready to put in the work.
+    </div>
+    
+    <div class="mt-12 mb-6">
+        <div class="writing-line"></div>
+        <p class="text-sm mt-2 ml-2" style="color: var(--gray);">Signature</p>
+    </div>
+    
+    <div class="mb-6">
+        <div class="writing-line"></div>
+        <p class="text-sm mt-2 ml-2" style="color: var(--gray);">Date</p>
+    </div>
+    
+    <div class="text-center mt-8">
+        <span style="font-size: 2em; filter: drop-shadow(0 0 5px var(--gold));">👑</span>
+    </div>
+    
+    <div class="footer-wisdom">Your standards define your reality. Upgrade them.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Pages 3-7: foundation pages (goals, vision, why, team, imprint)
+REGISTRY.register("foundation", '''<!-- PAGE {{page}}: {{label}} -->
+<div class="page">
+    <h1 class="text-center gold-gradient" style="font-size: 1.8em;">{{title}}</h1>
+    <div class="gold-line"></div>
+    
+    {{content}}
+    
+    <div class="footer-wisdom">{{wisdom}}</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# PLAN section divider
+REGISTRY.register("plan_divider", lambda: '''<!-- PAGE {{page}}: PLAN SECTION DIVIDER -->
+<div class="page">
+    <div class="section-divider">
+        <div class="font-serif" style="font-size: 5em; opacity: 0.08; color: var(--gold); margin-bottom: 16px;">01</div>
+        <div class="icon-gold mb-12">
+            ''' + SPRITE.use("icon-clock", 60, 60) + '''
+        </div>
+        <h1 class="section-title gold-gradient" style="font-size: 2.4em;">PLAN</h1>
+        <div class="gold-line" style="width: 160px; margin: 24px auto;"></div>
+        <p class="section-subtitle">Strategy turns ideas into reality</p>
+        
+        <div class="qr-placeholder mt-16" style="width: 120px; height: 120px;">
+            ''' + _qr_code("chapter2", 100, _qr_placeholder(100, "PLAN", 50, 55, 10)) + '''
+        </div>
+        <p class="qr-text">Access planning templates</p>
+    </div>
+</div>
+
+''')
+
+# Goal planning page
+REGISTRY.register("goal_breakdown", '''<!-- PAGE {{page}}: GOAL {{goal}} BREAKDOWN -->
+<div class="page">
+    <h2 class="text-center gold-gradient mb-6" style="font-size: 1.4em;">GOAL BREAKDOWN {{goal}}</h2>
+    <div class="gold-line"></div>
+    
+    <div class="priority-item" style="background: var(--black-soft); border: 1pt solid var(--gold-dark);">
+        <div class="checkbox"></div>
+        <div class="flex-1">
+            <h3 class="text-lg mb-3" style="font-size: 0.95em;">GOAL</h3>
+            <div class="writing-line"></div>
+        </div>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">CATEGORY</h3>
+    <div class="flex gap-3 text-sm mt-2" style="flex-wrap: wrap;">
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"> Work</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"> Health</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"> Financial</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"> Growth</label>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">COMPLETE BY</h3>
+    <div class="flex gap-3 text-sm mt-2" style="flex-wrap: wrap;">
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{{goal}}"> This Week</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{{goal}}"> This Month</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{{goal}}"> This Year</label>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">WHY DO I WANT IT?</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">OBSTACLES I MIGHT FACE</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">MY ACTION PLAN</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <div class="footer-wisdom">Execution beats intention every time.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Goal tasks page
+REGISTRY.register("goal_tasks", '''<!-- PAGE {{page}}: GOAL {{goal}} TASKS -->
+<div class="page">
+    <h2 class="text-center gold-gradient mb-4" style="font-size: 1.3em;">TASKS TO COMPLETE</h2>
+    <p class="text-center text-sm mb-6" style="color: var(--gray);">To reach goal {{goal}}</p>
+    <div class="gold-line"></div>
+    
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1"></div>
+    </div>
+    
+    <div class="card mt-6" style="background: linear-gradient(135deg, var(--black-soft), var(--gold-dark)); border: 1.5pt solid var(--gold); text-align: center; padding: 14px;">
+        <h3 class="text-lg mb-3" style="font-size: 0.95em;">✅ GOAL REACHED</h3>
+        <p class="text-sm" style="color: var(--gray);">Date: _______________</p>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">🎁 REWARD</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+    </div>
+    
+    <div class="footer-wisdom">Small wins compound into massive victories.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Goal planning page, filled from a goals row
+REGISTRY.register("goal_breakdown_entry", '''<!-- PAGE {{page}}: GOAL {{goal}} BREAKDOWN -->
+<div class="page">
+    <h2 class="text-center gold-gradient mb-6" style="font-size: 1.4em;">GOAL BREAKDOWN {{goal}}</h2>
+    <div class="gold-line"></div>
+    
+    <div class="priority-item" style="background: var(--black-soft); border: 1pt solid var(--gold-dark);">
+        <div class="checkbox"></div>
+        <div class="flex-1">
+            <h3 class="text-lg mb-3" style="font-size: 0.95em;">GOAL</h3>
+            <div class="writing-line">{{title}}</div>
+        </div>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">CATEGORY</h3>
+    <div class="flex gap-3 text-sm mt-2" style="flex-wrap: wrap;">
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"{{cat_work}}> Work</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"{{cat_health}}> Health</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"{{cat_financial}}> Financial</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="cat{{goal}}"{{cat_growth}}> Growth</label>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">COMPLETE BY</h3>
+    <div class="flex gap-3 text-sm mt-2" style="flex-wrap: wrap;">
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{{goal}}"> This Week</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{{goal}}"> This Month</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="radio" name="time{{goal}}"> This Year</label>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">WHY DO I WANT IT?</h3>
+    <div class="card">
+        <div class="writing-line">{{why_1}}</div>
+        <div class="writing-line">{{why_2}}</div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">OBSTACLES I MIGHT FACE</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">MY ACTION PLAN</h3>
+    <div class="card">
+        <div class="writing-line">{{plan_1}}</div>
+        <div class="writing-line">{{plan_2}}</div>
+    </div>
+    
+    <div class="footer-wisdom">Execution beats intention every time.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Goal tasks page, filled from a goals row
+REGISTRY.register("goal_tasks_entry", '''<!-- PAGE {{page}}: GOAL {{goal}} TASKS -->
+<div class="page">
+    <h2 class="text-center gold-gradient mb-4" style="font-size: 1.3em;">TASKS TO COMPLETE</h2>
+    <p class="text-center text-sm mb-6" style="color: var(--gray);">To reach goal {{goal}}</p>
+    <div class="gold-line"></div>
+    
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_1}}</div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_2}}</div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_3}}</div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_4}}</div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_5}}</div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_6}}</div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_7}}</div>
+    </div>
+    <div class="priority-item">
+        <div class="checkbox"></div>
+        <div class="writing-line flex-1">{{task_8}}</div>
+    </div>
+    
+    <div class="card mt-6" style="background: linear-gradient(135deg, var(--black-soft), var(--gold-dark)); border: 1.5pt solid var(--gold); text-align: center; padding: 14px;">
+        <h3 class="text-lg mb-3" style="font-size: 0.95em;">✅ GOAL REACHED</h3>
+        <p class="text-sm" style="color: var(--gray);">Date: {{reached}}</p>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">🎁 REWARD</h3>
+    <div class="card">
+        <div class="writing-line">{{reward}}</div>
+    </div>
+    
+    <div class="footer-wisdom">Small wins compound into massive victories.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# DO section divider
+REGISTRY.register("do_divider", lambda: '''<!-- PAGE {{page}}: DO SECTION DIVIDER -->
+<div class="page">
+    <div class="section-divider">
+        <div class="font-serif" style="font-size: 5em; opacity: 0.08; color: var(--gold); margin-bottom: 16px;">02</div>
+        <div class="icon-gold mb-12">
+            ''' + SPRITE.use("icon-star-do", 60, 60) + '''
+        </div>
+        <h1 class="section-title gold-gradient" style="font-size: 2.4em;">DO</h1>
+        <div class="gold-line" style="width: 160px; margin: 24px auto;"></div>
+        <p class="section-subtitle">Action is the bridge between<br>potential and success</p>
+        
+        <div class="qr-placeholder mt-16" style="width: 120px; height: 120px;">
+            ''' + _qr_code("chapter3", 100, _qr_placeholder(100, "DO", 50, 55, 10)) + '''
+        </div>
+        <p class="qr-text">Day mission audio</p>
+    </div>
+</div>
+
+''')
+
+# Daily spread, left page
+REGISTRY.register("day", '''<!-- PAGE {{page}}: DAY {{day}} -->
+<div class="page">
+    <div class="flex justify-between items-center mb-4" style="font-size: 0.85em;">
+        <div style="color: var(--gray); letter-spacing: 1px;">DAY {{day}}</div>
+        <div style="color: var(--gray);">{{date}}</div>
+    </div>
+    
+    <div class="quote-box text-sm">
+        {{quote_text}}
+        <div class="quote-author">— {{quote_author}}</div>
+    </div>
+    
+    <h3 style="font-size: 0.85em;">TODAY I AM GRATEFUL FOR...</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">TODAY'S PRIMARY GOAL</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+    </div>
+    
+    <div class="grid grid-cols-2 gap-4 mt-6">
+        <div>
+            <h3 class="text-sm" style="font-size: 0.8em;">TOP 3 PRIORITIES</h3>
+            <div class="priority-item">
+                <div class="checkbox"></div>
+                <div class="writing-line flex-1"></div>
+            </div>
+            <div class="priority-item">
+                <div class="checkbox"></div>
+                <div class="writing-line flex-1"></div>
+            </div>
+            <div class="priority-item">
+                <div class="checkbox"></div>
+                <div class="writing-line flex-1"></div>
+            </div>
+        </div>
+        
+        <div>
+            <h3 class="text-sm" style="font-size: 0.8em;">3 WINS I'M CREATING</h3>
+            <div class="card">
+                <div class="writing-line"></div>
+                <div class="writing-line"></div>
+                <div class="writing-line"></div>
+            </div>
+        </div>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">💪 WORKOUT</h3>
+    <div class="flex gap-3 text-sm mt-2">
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Cardio</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Weights</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Rest</label>
+    </div>
+    
+    <div class="footer-wisdom">{{wisdom}}</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Daily spread, right page
+REGISTRY.register("day_achieve", '''<!-- PAGE {{page}}: DAY {{day}} ACHIEVE -->
+<div class="page">
+    <div class="flex justify-between items-center mb-4" style="font-size: 0.85em;">
+        <div style="color: var(--gray); letter-spacing: 1px;">DAY {{day}} • ACHIEVE</div>
+        <div style="color: var(--gray);">{{date}}</div>
+    </div>
+    
+    <h2 class="text-center gold-gradient mb-6" style="font-size: 1.4em;">Daily Achieve</h2>
+    <div class="gold-line"></div>
+    
+    <div class="grid grid-cols-2 gap-4 mt-4">
+        <div class="card">
+            <h3 class="text-sm card-header" style="font-size: 0.8em;">✅ WHAT I ACHIEVED</h3>
+            <div class="writing-line"></div>
+            <div class="writing-line"></div>
+            <div class="writing-line"></div>
+        </div>
+        
+        <div class="card">
+            <h3 class="text-sm card-header" style="font-size: 0.8em;">📈 HOW I CAN IMPROVE</h3>
+            <div class="writing-line"></div>
+            <div class="writing-line"></div>
+            <div class="writing-line"></div>
+        </div>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">🏆 WINS TODAY</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">💡 LESSONS LEARNED</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">🎯 TOMORROW I WILL...</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+    </div>
+    
+    <div class="text-center mt-6">
+        <span style="font-size: 2em; filter: drop-shadow(0 0 5px var(--gold));">⚔️</span>
+    </div>
+    
+    <div class="footer-wisdom">Reflection is where growth happens.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Daily spread, left page, filled from a journal_entries row
+REGISTRY.register("day_entry", '''<!-- PAGE {{page}}: DAY {{day}} -->
+<div class="page">
+    <div class="flex justify-between items-center mb-4" style="font-size: 0.85em;">
+        <div style="color: var(--gray); letter-spacing: 1px;">DAY {{day}}</div>
+        <div style="color: var(--gray);">{{date}}</div>
+    </div>
+    
+    <div class="quote-box text-sm">
+        {{quote_text}}
+        <div class="quote-author">— {{quote_author}}</div>
+    </div>
+    
+    <h3 style="font-size: 0.85em;">TODAY I AM GRATEFUL FOR...</h3>
+    <div class="card">
+        <div class="writing-line">{{gratitude}}</div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">TODAY'S PRIMARY GOAL</h3>
+    <div class="card">
+        <div class="writing-line">{{primary_goal}}</div>
+    </div>
+    
+    <div class="grid grid-cols-2 gap-4 mt-6">
+        <div>
+            <h3 class="text-sm" style="font-size: 0.8em;">TOP 3 PRIORITIES</h3>
+            <div class="priority-item">
+                <div class="checkbox"></div>
+                <div class="writing-line flex-1">{{priority_1}}</div>
+            </div>
+            <div class="priority-item">
+                <div class="checkbox"></div>
+                <div class="writing-line flex-1">{{priority_2}}</div>
+            </div>
+            <div class="priority-item">
+                <div class="checkbox"></div>
+                <div class="writing-line flex-1">{{priority_3}}</div>
+            </div>
+        </div>
+        
+        <div>
+            <h3 class="text-sm" style="font-size: 0.8em;">3 WINS I'M CREATING</h3>
+            <div class="card">
+                <div class="writing-line">{{win_1}}</div>
+                <div class="writing-line">{{win_2}}</div>
+                <div class="writing-line">{{win_3}}</div>
+            </div>
+        </div>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">💪 WORKOUT</h3>
+    <div class="flex gap-3 text-sm mt-2">
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Cardio</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Weights</label>
+        <label class="flex items-center gap-2" style="color: var(--gray);"><input type="checkbox"> Rest</label>
+    </div>
+    
+    <div class="footer-wisdom">{{wisdom}}</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Daily spread, right page, filled from a journal_entries row
+REGISTRY.register("day_achieve_entry", '''<!-- PAGE {{page}}: DAY {{day}} ACHIEVE -->
+<div class="page">
+    <div class="flex justify-between items-center mb-4" style="font-size: 0.85em;">
+        <div style="color: var(--gray); letter-spacing: 1px;">DAY {{day}} • ACHIEVE{{mood}}</div>
+        <div style="color: var(--gray);">{{date}}</div>
+    </div>
+    
+    <h2 class="text-center gold-gradient mb-6" style="font-size: 1.4em;">Daily Achieve</h2>
+    <div class="gold-line"></div>
+    
+    <div class="grid grid-cols-2 gap-4 mt-4">
+        <div class="card">
+            <h3 class="text-sm card-header" style="font-size: 0.8em;">✅ WHAT I ACHIEVED</h3>
+            <div class="writing-line">{{achieved_1}}</div>
+            <div class="writing-line">{{achieved_2}}</div>
+            <div class="writing-line">{{achieved_3}}</div>
+        </div>
+        
+        <div class="card">
+            <h3 class="text-sm card-header" style="font-size: 0.8em;">📈 HOW I CAN IMPROVE</h3>
+            <div class="writing-line"></div>
+            <div class="writing-line"></div>
+            <div class="writing-line"></div>
+        </div>
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">🏆 WINS TODAY</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">💡 LESSONS LEARNED</h3>
+    <div class="card">
+        <div class="writing-line">{{lesson_1}}</div>
+        <div class="writing-line">{{lesson_2}}</div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">🎯 TOMORROW I WILL...</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+    </div>
+    
+    <div class="text-center mt-6">
+        <span style="font-size: 2em; filter: drop-shadow(0 0 5px var(--gold));">⚔️</span>
+    </div>
+    
+    <div class="footer-wisdom">Reflection is where growth happens.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# ACHIEVE section divider
+REGISTRY.register("achieve_divider", lambda: '''<!-- PAGE {{page}}: ACHIEVE SECTION DIVIDER -->
+<div class="page">
+    <div class="section-divider">
+        <div class="font-serif" style="font-size: 5em; opacity: 0.08; color: var(--gold); margin-bottom: 16px;">03</div>
+        <div class="icon-gold mb-12">
+            ''' + SPRITE.use("icon-star-achieve", 60, 60) + '''
+        </div>
+        <h1 class="section-title gold-gradient" style="font-size: 2.4em;">ACHIEVE</h1>
+        <div class="gold-line" style="width: 160px; margin: 24px auto;"></div>
+        <p class="section-subtitle">Measured growth is mastery</p>
+        
+        <div class="qr-placeholder mt-16" style="width: 120px; height: 120px;">
+            ''' + _qr_code("chapter4", 100, _qr_placeholder(100, "ACHIEVE", 50, 55, 9)) + '''
+        </div>
+        <p class="qr-text">Weekly insights</p>
+    </div>
+</div>
+
+''')
+
+# Weekly achieve review
+REGISTRY.register("week_review", '''<!-- PAGE {{page}}: WEEK {{week}} ACHIEVE REVIEW -->
+<div class="page">
+    <h1 class="text-center gold-gradient mb-3" style="font-size: 1.6em;">Weekly Achieve</h1>
+    <h2 class="text-center mb-2" style="color: var(--gold-metallic); font-size: 1.2em;">WEEK {{week}}</h2>
+    <p class="text-center text-sm mb-6 tracking-widest uppercase" style="color: var(--gray);">{{theme}}{{dates}}</p>
+    <div class="gold-line"></div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">📊 HABIT TRACKER</h3>
+    <div class="grid-tracker">
+        <div class="grid-cell text-xs font-bold">{{weekday_1}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_2}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_3}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_4}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_5}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_6}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_7}}</div>
+        ''' + _GRID_CELLS + '''
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">⭐ TOP 3 WINS</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">⚠️ TOP 3 CHALLENGES</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">🎯 GOALS FOR NEXT WEEK</h3>
+    <div class="card">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <div class="card mt-6 text-center" style="background: linear-gradient(135deg, var(--black-soft), var(--gold-dark)); border: 1.5pt solid var(--gold); padding: 12px;">
+        <h3 style="font-size: 1.1em;">WEEK RATING: <span style="font-size: 1.5em; margin-left: 10px;">___ / 10</span></h3>
+    </div>
+    
+    <div class="footer-wisdom">Progress is the only metric that matters.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Weekly achieve review, filled from a weekly_reviews row
+REGISTRY.register("week_review_entry", '''<!-- PAGE {{page}}: WEEK {{week}} ACHIEVE REVIEW -->
+<div class="page">
+    <h1 class="text-center gold-gradient mb-3" style="font-size: 1.6em;">Weekly Achieve</h1>
+    <h2 class="text-center mb-2" style="color: var(--gold-metallic); font-size: 1.2em;">WEEK {{week}}</h2>
+    <p class="text-center text-sm mb-6 tracking-widest uppercase" style="color: var(--gray);">{{theme}}{{dates}}</p>
+    <div class="gold-line"></div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">📊 HABIT TRACKER</h3>
+    <div class="grid-tracker">
+        <div class="grid-cell text-xs font-bold">{{weekday_1}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_2}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_3}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_4}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_5}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_6}}</div>
+        <div class="grid-cell text-xs font-bold">{{weekday_7}}</div>
+        ''' + _GRID_CELLS + '''
+    </div>
+    
+    <h3 class="mt-6" style="font-size: 0.85em;">⭐ TOP 3 WINS</h3>
+    <div class="card">
+        <div class="writing-line">{{win_1}}</div>
+        <div class="writing-line">{{win_2}}</div>
+        <div class="writing-line">{{win_3}}</div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">⚠️ TOP 3 CHALLENGES</h3>
+    <div class="card">
+        <div class="writing-line">{{challenge_1}}</div>
+        <div class="writing-line">{{challenge_2}}</div>
+        <div class="writing-line">{{challenge_3}}</div>
+    </div>
+    
+    <h3 class="mt-4" style="font-size: 0.85em;">🎯 GOALS FOR NEXT WEEK</h3>
+    <div class="card">
+        <div class="writing-line">{{next_1}}</div>
+        <div class="writing-line">{{next_2}}</div>
+    </div>
+    
+    <div class="card mt-6 text-center" style="background: linear-gradient(135deg, var(--black-soft), var(--gold-dark)); border: 1.5pt solid var(--gold); padding: 12px;">
+        <h3 style="font-size: 1.1em;">WEEK RATING: <span style="font-size: 1.5em; margin-left: 10px;">___ / 10</span></h3>
+    </div>
+    
+    <div class="footer-wisdom">Progress is the only metric that matters.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Victory divider
+REGISTRY.register("victory_divider", '''<!-- PAGE {{page}}: VICTORY DIVIDER -->
+<div class="page">
+    <div class="section-divider" style="padding-top: 60px;">
+        <div class="icon-gold mb-12" style="font-size: 4em;">
+            ''' + SPRITE.use("icon-star", 80, 80) + '''
+        </div>
+        <h1 class="gold-gradient" style="font-size: 3em; letter-spacing: 8px;">VICTORY</h1>
+        <div class="gold-line" style="width: 200px; margin: 24px auto;"></div>
+    </div>
+</div>
+
+''')
+
+# You did it
+REGISTRY.register("you_did_it", lambda: '''<!-- PAGE {{page}}: YOU DID IT -->
+<div class="page">
+    <div class="section-divider" style="padding-top: 50px;">
+        <div class="icon-gold mb-8" style="font-size: 4.5em;">👑</div>
+        <h1 class="gold-gradient mb-6" style="font-size: 3.2em; letter-spacing: 8px;">YOU DID IT</h1>
+        <div class="gold-line" style="width: 200px; margin: 24px auto;"></div>
+        
+        <p class="text-2xl mt-8 tracking-widest" style="color: var(--gray);">DISCIPLINE • GROWTH • MASTERY</p>
+        
+        <div class="quote-box mt-12 text-sm" style="max-width: 90%; margin-left: auto; margin-right: auto;">
+            The credit belongs to the man who is actually in the arena, whose face is marred by dust and sweat and blood; who strives valiantly; who errs, who comes short again and again, because there is no effort without error and shortcoming.
+            <div class="quote-author">— THEODORE ROOSEVELT</div>
+        </div>
+        
+        <p class="text-3xl font-bold gold-gradient mt-12" style="letter-spacing: 3px;">NOW GO BUILD<br>YOUR EMPIRE</p>
+        
+        <div class="qr-placeholder mt-12" style="width: 140px; height: 140px;">
+            ''' + _qr_code("chapter5", 120, _qr_placeholder(120, "GUILD", 60, 65, 11)) + '''
+        </div>
+        <p class="qr-text">Join the Builder's Guild</p>
+    </div>
+</div>
+
+''')
+
+# Notes
+REGISTRY.register("notes", '''<!-- PAGE {{page}}: NOTES -->
+<div class="page">
+    <h1 class="text-center gold-gradient mb-6" style="font-size: 1.8em;">Notes</h1>
+    <div class="gold-line"></div>
+    
+    <div class="card" style="min-height: 450px;">
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+        <div class="writing-line"></div>
+    </div>
+    
+    <div class="footer-wisdom">Write the next chapter.</div>
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Legacy message
+REGISTRY.register("legacy_message", '''<!-- PAGE {{page}}: ACKNOWLEDGEMENTS / LEGACY MESSAGE -->
+<div class="page">
+    <h1 class="text-center gold-gradient mb-6" style="font-size: 1.8em;">Legacy Message</h1>
+    <div class="gold-line"></div>
+    
+    <div class="quote-box mt-8 text-sm">
+        You've completed this journey. But completion is not the end—it's proof that you can commit, execute, and achieve.
+        <br><br>
+        Every page you filled was a vote for the person you're becoming. Every goal you set was a declaration of your standards. Every reflection was an investment in your growth.
+        <br><br>
+        <strong class="not-italic" style="color: var(--gold-metallic);">This is not where it ends. This is where it begins.</strong>
+        <br><br>
+        The system works because you worked it. The journal succeeded because you showed up. Now take everything you've learned and build something that lasts.
+    </div>
+    
+    <div class="card mt-12" style="background: linear-gradient(135deg, var(--gold-dark), var(--black-soft)); border: 1.5pt solid var(--gold); padding: 20px; text-align: center;">
+        <h3 style="font-size: 1.2em; color: var(--white);">Your legacy awaits.</h3>
+        <p class="mt-4 text-sm" style="color: var(--white);">Start the next journal. Join the community. Build your empire.</p>
+    </div>
+    
+    <div class="text-center mt-12">
+        <span style="font-size: 3em; filter: drop-shadow(0 0 8px var(--gold));">👑</span>
+    </div>
+    
+    <div style="position: absolute; bottom: 18mm; text-align: center; width: 100%;">
+        <p class="text-xs tracking-wider" style="color: var(--gray);">LEVERAGE APP © 2025</p>
+        <p class="text-xs mt-2" style="color: var(--gold-dark);">Built for empire builders</p>
+    </div>
+    
+    <div class="page-number"></div>
+</div>
+
+''')
+
+# Sharded output: placeholder for a section that is fetched as it scrolls into view
+REGISTRY.register("shard_slot", '''<div class="journal-shard" data-src="{{src}}" data-pages="{{pages}}" style="min-height: calc({{count}} * (210mm + 1rem));"></div>
+''')
+
+# Sharded output: swaps each placeholder for its shard once it nears the viewport;
+# Ctrl/Cmd+P loads every remaining shard before opening the print dialog
+REGISTRY.register("shard_loader", '''<script>
+(function () {
+    var slots = Array.prototype.slice.call(document.querySelectorAll('.journal-shard'));
+    var observer = 'IntersectionObserver' in window && new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (entry.isIntersecting) load(entry.target);
+        });
+    }, { rootMargin: '200% 0px' });
+    function load(slot) {
+        if (slot.loading) return slot.loading;
+        if (observer) observer.unobserve(slot);
+        slot.loading = fetch(slot.getAttribute('data-src')).then(function (response) {
+            if (!response.ok) throw new Error(response.status);
+            return response.text();
+        }).then(function (html) {
+            slot.insertAdjacentHTML('beforebegin', html);
+            slot.parentNode.removeChild(slot);
+        }, function () {
+            slot.loading = null;
+            if (observer) observer.observe(slot);
+        });
+        return slot.loading;
+    }
+    window.loadAllJournalPages = function () {
+        return Promise.all(slots.filter(function (slot) { return slot.parentNode; }).map(load));
+    };
+    // beforeprint cannot wait for a fetch, so printing goes through here:
+    // every shard is in the page before the print dialog opens
+    window.printJournal = function () {
+        return window.loadAllJournalPages().then(function () { window.print(); });
+    };
+    if (observer) slots.forEach(function (slot) { observer.observe(slot); });
+    else window.loadAllJournalPages();
+    document.addEventListener('keydown', function (event) {
+        if ((event.ctrlKey || event.metaKey) && !event.altKey && (event.key === 'p' || event.key === 'P')) {
+            if (!slots.some(function (slot) { return slot.parentNode; })) return;
+            event.preventDefault();
+            window.printJournal();
+        }
+    });
+    // Best effort for the browser's own Print menu, which cannot be held back
+    window.addEventListener('beforeprint', window.loadAllJournalPages);
+})();
+</script>
+''')
+
+# Close HTML
+REGISTRY.register("document_tail", '''</body>
+</html>''')
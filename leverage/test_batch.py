@@ -0,0 +1,34 @@
+"""Tests for the batch renderer."""
+
+import os
+
+import pytest
+
+from batch import BatchRenderer, output_path
+
+def test_shared_pages_stay_bounded_across_seeded_users(tmp_path):
+    renderer = BatchRenderer(days=14)
+    renderer.write({"user_id": "first", "quote_seed": "first"}, os.path.join(tmp_path, "first.html"))
+    baseline = len(renderer._shared)
+    for n in range(50):
+        record = {"user_id": f"user-{n}", "quote_seed": f"seed-{n}"}
+        renderer.write(record, os.path.join(tmp_path, f"{record['user_id']}.html"))
+    assert len(renderer._shared) == baseline
+    assert renderer.reused > 0
+
+def test_unseeded_users_share_day_pages(tmp_path):
+    renderer = BatchRenderer(days=14)
+    renderer.write({"user_id": "a"}, os.path.join(tmp_path, "a.html"))
+    rendered = renderer.rendered
+    renderer.write({"user_id": "b"}, os.path.join(tmp_path, "b.html"))
+    assert renderer.rendered == rendered
+
+def test_output_path_rejects_ids_that_leave_the_output_dir(tmp_path):
+    for user_id in ("../x", "a/b", "..", ".hidden", ""):
+        with pytest.raises(ValueError):
+            output_path(str(tmp_path), {"user_id": user_id}, ".html")
+    assert output_path("out", {"user_id": 42}, ".html") == os.path.join("out", "42.html")
+
+def test_journals_are_world_readable(tmp_path):
+    BatchRenderer(days=7).run([{"user_id": "reader"}], str(tmp_path))
+    assert os.stat(os.path.join(tmp_path, "reader.html")).st_mode & 0o777 == 0o644
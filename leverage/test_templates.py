@@ -0,0 +1,26 @@
+"""Tests for the page template registry and its QR codes."""
+
+import os
+import subprocess
+import sys
+
+import qr
+from templates import REGISTRY, SPRITE
+
+def test_sprite_symbols_are_defined_once_and_resolve():
+    for name in REGISTRY:
+        REGISTRY.get(name)
+    SPRITE.check(REGISTRY)
+
+def test_import_encodes_no_qr_codes():
+    code = "import templates; print(templates._qr_symbols.cache_info().currsize)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.abspath(qr.__file__))).stdout
+    assert out.strip() == "0"
+
+def test_codes_keep_a_four_module_quiet_zone(tmp_path):
+    url = "https://leveragejournal.com"
+    size, path = qr.QrCache(os.path.join(tmp_path, "qr-cache.json")).get(url)
+    assert size == len(qr.encode(url)) + 8
+    # The top-left finder pattern starts the path at the corner of the quiet zone
+    assert path.startswith("M4 4h7")